@@ -12,6 +12,7 @@ import glob
 from pathlib import Path
 import pytz
 import warnings
+from operator import itemgetter
 # Suppress only the pandas FutureWarning triggered by Plotly when converting
 # datetime Series to NumPy arrays. This keeps the console clean while leaving
 # all other warnings visible.
@@ -22,10 +23,80 @@ warnings.filterwarnings(
 )
 
 # Import configuration and data loading
-from src.config import configure_page, apply_custom_styling, APP_TITLE, DEFAULT_TIMEZONE, ENABLE_GDRIVE_SYNC
-from src.data_loader import load_data, sync_from_gdrive, find_latest_data_file
-from src.data_processor import get_duration_analysis_data, get_quality_analysis_data, get_patterns_analysis_data, get_data_overview_info, clear_processing_cache
-from src.advanced_analytics import display_moving_variance_analysis, display_extreme_outliers, display_recording_frequency, display_day_of_week_variability, display_sleep_time_polar_plot, display_sleep_time_polar_plot_nap_view
+from src.config import configure_page, apply_custom_styling, APP_TITLE, DEFAULT_TIMEZONE, ENABLE_GDRIVE_SYNC, MAX_CHART_POINTS, FIGURE_CACHE_ENTRIES
+from src.data_loader import load_data, sync_from_gdrive, find_latest_data_file, list_data_files, clear_data_cache
+from src.data_processor import get_duration_analysis_data, get_daily_summary_stats, get_quality_analysis_data, get_patterns_analysis_data, get_data_overview_info, get_sidebar_stats, clear_processing_cache, compute_histogram, get_multi_session_details, minmax_decimate_indices
+from src.advanced_analytics import rolling_mean, display_moving_variance_analysis, display_extreme_outliers, display_recording_frequency, display_day_of_week_variability, display_sleep_time_polar_plot, display_sleep_time_polar_plot_nap_view
+
+# Shared Plotly layout pieces, built once at import instead of on every rerun
+STD_MARGIN = dict(t=40, b=40, l=40, r=40)
+HOUR_AXIS = dict(tickmode='linear', tick0=0, dtick=1)
+LEGEND_BOTTOM = dict(orientation="h", yanchor="top", y=-0.22, xanchor="center", x=0.5)
+HOUR_BINS = np.arange(0, 25)
+HIST_LAYOUT = go.Layout(
+    bargap=0.2,
+    xaxis=dict(tickmode='linear', tick0=0, dtick=0.5, tickformat='.1f'),
+    margin=STD_MARGIN
+)
+BAR_LAYOUT = go.Layout(margin=STD_MARGIN)
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_daily_sleep_timeline(daily_sleep):
+    """
+    Build the daily sleep bar chart with its 10-day moving average overlay.
+    Cached as a resource so reruns with unchanged data reuse the same figure.
+    """
+    # Timeline Analysis (very long histories are decimated to their min/max envelope)
+    bars = daily_sleep
+    if len(daily_sleep) > MAX_CHART_POINTS:
+        bars = daily_sleep.iloc[minmax_decimate_indices(daily_sleep['Hours'].to_numpy(), MAX_CHART_POINTS)]
+    fig1 = px.bar(bars, x='Date', y='Hours',
+                  title='Total Sleep Duration Per Day',
+                  labels={'Date': 'Date', 'Hours': 'Total Sleep Hours'})
+    fig1.add_hline(y=8, line_dash="dash", line_color="green",
+                   annotation_text="Ideal Sleep",
+                   annotation_position="top right")
+
+    # Add 10-day moving average overlay
+    if len(daily_sleep) >= 10:
+        daily_sleep_sorted = daily_sleep.sort_values('Date')
+        daily_sleep_sorted['Moving_Avg_10'] = rolling_mean(daily_sleep_sorted['Hours'].to_numpy(), 10)
+
+        # Add moving average line (only where we have enough data)
+        ma_data = daily_sleep_sorted.dropna(subset=['Moving_Avg_10'])
+        if len(ma_data) > MAX_CHART_POINTS:
+            ma_data = ma_data.iloc[minmax_decimate_indices(ma_data['Moving_Avg_10'].to_numpy(), MAX_CHART_POINTS)]
+        if len(ma_data) > 0:
+            fig1.add_trace(go.Scattergl(
+                x=ma_data['Date'],
+                y=ma_data['Moving_Avg_10'],
+                mode='lines',
+                name='10-Day Moving Average',
+                line=dict(color='orange', width=3),
+                hovertemplate='<b>10-Day Average</b><br>Date: %{x}<br>Hours: %{y:.1f}<extra></extra>'
+            ))
+
+    max_hours = daily_sleep['Hours'].max()
+    y_max = 2 * (max_hours // 2) + 2
+    fig1.update_layout(
+        yaxis=dict(tickmode='linear', tick0=0, dtick=2, range=[0, y_max], gridcolor='lightgray', griddash='dash'),
+        showlegend=True,
+        legend=LEGEND_BOTTOM
+    )
+    return fig1
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_daily_sleep_histogram(daily_sleep):
+    """Build the distribution chart of daily total sleep duration."""
+    # Sleep duration distribution (binned once with NumPy, drawn as plain bars)
+    counts, centers, _ = compute_histogram(daily_sleep['Hours'].to_numpy(), 20)
+    fig2 = go.Figure(go.Bar(x=centers, y=counts))
+    fig2.update_layout(HIST_LAYOUT)
+    fig2.update_layout(title='Distribution of Daily Total Sleep Duration',
+                       xaxis_title='Total Sleep Hours', yaxis_title='Frequency')
+    return fig2
+
 
 # Configure page settings
 configure_page()
@@ -49,93 +120,48 @@ try:
         st.warning(f"No data loaded. Source description: {source_description}")
         st.stop()  # Stop execution if no data loaded
         
-    # Create dashboard layout with tabs
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+    # Duration views are shared by the first three sections; compute them once per rerun
+    plot_df, daily_sleep, processing_info = None, None, {}
+    if {'From', 'To', 'Hours'}.issubset(df.columns):
+        plot_df, daily_sleep, processing_info = get_duration_analysis_data(df)
+        # Store processing info in session state for notifications view
+        st.session_state.processing_info = processing_info
+
+    # Create dashboard layout. Unlike st.tabs, a view selector only runs
+    # the code for the section being shown on each rerun.
+    views = [
         "📈 Sleep Duration & Trends", 
         "🕐 Sleep Patterns & Timing",
         "🔬 Sleep Variance",
         "💤 Sleep Quality & Metrics", 
         "📋 Raw Data & Overview", 
         "🔔 Notifications & Processing"
-    ])
+    ]
+    active_view = st.radio("View", views, horizontal=True, label_visibility="collapsed", key="active_view")
     
-    with tab1:
+    if active_view == views[0]:
         
         try:
             if 'From' not in df.columns or 'Hours' not in df.columns:
                 st.error("Could not find required columns for sleep duration analysis")
             else:
-                # Use the centralized data processor
-                plot_df, daily_sleep, processing_info = get_duration_analysis_data(df)
-                
                 if plot_df is not None and len(plot_df) > 0:
-                    # Store processing info in session state for notifications tab
-                    st.session_state.processing_info = processing_info
-                    
-                    # Timeline Analysis
-                    fig1 = px.bar(daily_sleep, x='Date', y='Hours', 
-                                title='Total Sleep Duration Per Day',
-                                labels={'Date': 'Date', 'Hours': 'Total Sleep Hours'})
-                    fig1.add_hline(y=8, line_dash="dash", line_color="green", 
-                                    annotation_text="Ideal Sleep", 
-                                    annotation_position="top right")
-                    
-                    # Add 10-day moving average overlay
-                    if len(daily_sleep) >= 10:
-                        daily_sleep_sorted = daily_sleep.sort_values('Date')
-                        daily_sleep_sorted['Moving_Avg_10'] = daily_sleep_sorted['Hours'].rolling(window=10, min_periods=10).mean()
-                        
-                        # Add moving average line (only where we have enough data)
-                        ma_data = daily_sleep_sorted.dropna(subset=['Moving_Avg_10'])
-                        if len(ma_data) > 0:
-                            fig1.add_scatter(
-                                x=ma_data['Date'], 
-                                y=ma_data['Moving_Avg_10'],
-                                mode='lines',
-                                name='10-Day Moving Average',
-                                line=dict(color='orange', width=3),
-                                hovertemplate='<b>10-Day Average</b><br>Date: %{x}<br>Hours: %{y:.1f}<extra></extra>'
-                            )
-                    
-                    max_hours = daily_sleep['Hours'].max()
-                    y_max = 2 * (max_hours // 2) + 2
-                    fig1.update_layout(
-                        yaxis=dict(tickmode='linear', tick0=0, dtick=2, range=[0, y_max], gridcolor='lightgray', griddash='dash'),
-                        showlegend=True,
-                        legend=dict(
-                            orientation="h",
-                            yanchor="top",
-                            y=-0.22,
-                            xanchor="center",
-                            x=0.5
-                        )
-                    )
-                    st.plotly_chart(fig1, use_container_width=True)
-                    
-                    # Sleep duration distribution
-                    fig2 = px.histogram(daily_sleep, x='Hours', nbins=20, 
-                                        title='Distribution of Daily Total Sleep Duration',
-                                        labels={'Hours': 'Total Sleep Hours', 'count': 'Frequency'})
-                    fig2.update_layout(
-                        bargap=0.2,
-                        xaxis=dict(tickmode='linear', tick0=0, dtick=0.5, tickformat='.1f'),
-                        margin=dict(t=40, b=40, l=40, r=40)
-                    )
-                    st.plotly_chart(fig2, use_container_width=True)
+                    st.plotly_chart(build_daily_sleep_timeline(daily_sleep), use_container_width=True)
+                    st.plotly_chart(build_daily_sleep_histogram(daily_sleep), use_container_width=True)
 
-                    # Overall Sleep Statistics
+                    # Overall Sleep Statistics (precomputed with the cached duration data)
+                    avg_sleep, median_sleep, sleep_range = itemgetter(
+                        'avg_hours', 'median_hours', 'range_hours'
+                    )(get_daily_summary_stats(daily_sleep))
+                    multi_session_days = processing_info['multi_session_days']
                     col1, col2, col3, col4 = st.columns(4)
                     with col1:
-                        avg_sleep = daily_sleep['Hours'].mean()
                         st.metric("Average Sleep", f"{avg_sleep:.1f} hours")
                     with col2:
-                        median_sleep = daily_sleep['Hours'].median()
                         st.metric("Median Sleep", f"{median_sleep:.1f} hours")
                     with col3:
-                        sleep_range = daily_sleep['Hours'].max() - daily_sleep['Hours'].min()
                         st.metric("Range", f"{sleep_range:.1f} hours")
                     with col4:
-                        multi_session_days = processing_info['multi_session_days']
                         st.metric("Days with Multiple Sleep Periods", f"{multi_session_days}")
 
                     # Create columns for layout
@@ -145,23 +171,11 @@ try:
                         display_recording_frequency(daily_sleep, plot_df)
                     
                     with col_quality2:
-                        multi_session_days = processing_info.get('multi_session_days', 0)
                         if multi_session_days > 0:
                             with st.expander(f"Multiple sessions: {multi_session_days} days"):
-                                # Count number of records per day
-                                sleep_count = plot_df.groupby('Date').size().reset_index(name='Count')
-                                # Filter to days with multiple records
-                                multi_days = sleep_count[sleep_count['Count'] > 1]
-                                
                                 st.write("**Days with multiple sleep records**:")
-                                details = plot_df[plot_df['Date'].isin(multi_days['Date'])].sort_values(['Date', 'Hours'], ascending=[True, False])
-                                
-                                # Display with formatting
-                                display_details = details[['Date', 'From', 'To', 'Hours']].copy()
-                                display_details['From'] = display_details['From'].dt.strftime('%H:%M')
-                                display_details['To'] = display_details['To'].dt.strftime('%H:%M')
                                 st.dataframe(
-                                    display_details,
+                                    get_multi_session_details(plot_df),
                                     column_config={
                                         "Date": "Date",
                                         "From": "Start Time", 
@@ -179,11 +193,10 @@ try:
         except Exception as e:
             st.error(f"Error analyzing sleep duration: {str(e)}")
     
-    with tab2:
+    elif active_view == views[1]:
         
         try:
             # Use the centralized data processor
-            plot_df, daily_sleep, processing_info = get_duration_analysis_data(df)
             patterns_df = get_patterns_analysis_data(df)
             
             if patterns_df is not None and len(patterns_df) > 0:
@@ -191,13 +204,14 @@ try:
                 # Bedtime and Wake Time Distributions
                 col1, col2 = st.columns(2)
                 with col1:
-                    bedtime_hours = patterns_df['From'].dt.hour + patterns_df['From'].dt.minute / 60
-                    fig_bedtime = px.histogram(x=bedtime_hours, nbins=24, title="Bedtime Distribution (24h)", labels={'x': 'Hour of Day'})
+                    counts, centers, widths = compute_histogram(patterns_df['bedtime'].to_numpy(), HOUR_BINS)
+                    fig_bedtime = go.Figure(go.Bar(x=centers, y=counts, width=widths))
                     fig_bedtime.update_layout(
+                        title="Bedtime Distribution (24h)",
                         xaxis_title="Hour of Day (e.g., 23.5 = 11:30 PM)", 
                         yaxis_title="Frequency",
-                        xaxis=dict(tickmode='linear', tick0=0, dtick=1),
-                        margin=dict(t=40, b=40, l=40, r=40)
+                        xaxis=HOUR_AXIS,
+                        margin=STD_MARGIN
                     )
                     
                     # Add hour labels - simpler approach
@@ -206,13 +220,14 @@ try:
                     st.plotly_chart(fig_bedtime, use_container_width=True)
 
                 with col2:
-                    wake_time_hours = patterns_df['To'].dt.hour + patterns_df['To'].dt.minute / 60
-                    fig_wake_time = px.histogram(x=wake_time_hours, nbins=24, title="Wake Time Distribution (24h)", labels={'x': 'Hour of Day'})
+                    counts, centers, widths = compute_histogram(patterns_df['waketime'].to_numpy(), HOUR_BINS)
+                    fig_wake_time = go.Figure(go.Bar(x=centers, y=counts, width=widths))
                     fig_wake_time.update_layout(
+                        title="Wake Time Distribution (24h)",
                         xaxis_title="Hour of Day (e.g., 7.5 = 7:30 AM)", 
                         yaxis_title="Frequency",
-                        xaxis=dict(tickmode='linear', tick0=0, dtick=1),
-                        margin=dict(t=40, b=40, l=40, r=40)
+                        xaxis=HOUR_AXIS,
+                        margin=STD_MARGIN
                     )
                     
                     # Add hour labels - simpler approach
@@ -229,34 +244,30 @@ try:
                     st.info("A lower standard deviation indicates a more consistent sleep schedule.")
                 
                 # Average Sleep by Day of Week & Tracking Frequency
-                daily_sleep['Day_of_Week'] = daily_sleep['Date'].dt.day_name()
-                day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+                # One grouping pass over the precomputed ordered weekday feeds both weekly charts
+                day_summary = daily_sleep.groupby('Day_of_Week', observed=False)['Hours'].agg(['mean', 'count'])
                 
                 col_weekly1, col_weekly2 = st.columns(2)
                 with col_weekly1:
-                    day_avg = daily_sleep.groupby('Day_of_Week')['Hours'].mean().reindex(day_order).reset_index()
+                    day_avg = day_summary['mean'].rename('Hours').rename_axis('Day_of_Week').reset_index()
                     fig_day_avg = px.bar(day_avg, x='Day_of_Week', y='Hours', title='Average Sleep Duration by Day', labels={'Day_of_Week': 'Day', 'Hours': 'Average Sleep Hours'})
-                    fig_day_avg.update_traces(text=[f"{val:.1f}h" for val in day_avg['Hours']], textposition='outside')
-                    fig_day_avg.update_layout(margin=dict(t=40, b=40, l=40, r=40))
+                    fig_day_avg.update_traces(text=day_avg['Hours'].map('{:.1f}h'.format).to_numpy(), textposition='outside')
+                    fig_day_avg.update_layout(BAR_LAYOUT)
                     st.plotly_chart(fig_day_avg, use_container_width=True)
                     
                 with col_weekly2:
-                    day_counts = daily_sleep['Day_of_Week'].value_counts().reindex(day_order).reset_index()
-                    day_counts.columns = ['Day_of_Week', 'Count']
+                    day_counts = day_summary['count'].rename('Count').rename_axis('Day_of_Week').reset_index()
                     fig_day_counts = px.bar(day_counts, x='Day_of_Week', y='Count', title='Number of Tracked Days by Day of Week', labels={'Day_of_Week': 'Day', 'Count': 'Number of Days Tracked'})
-                    fig_day_counts.update_traces(text=[f"{val}" for val in day_counts['Count']], textposition='outside')
-                    fig_day_counts.update_layout(margin=dict(t=40, b=40, l=40, r=40))
+                    fig_day_counts.update_traces(text=day_counts['Count'].map('{}'.format).to_numpy(), textposition='outside')
+                    fig_day_counts.update_layout(BAR_LAYOUT)
                     st.plotly_chart(fig_day_counts, use_container_width=True)
 
         except Exception as e:
             st.error(f"Error analyzing sleep patterns: {str(e)}")
 
-    with tab3:
+    elif active_view == views[2]:
         
         try:
-            # Use the centralized data processor for source data
-            plot_df, daily_sleep, processing_info = get_duration_analysis_data(df)
-            
             # Display analyses
             display_moving_variance_analysis(daily_sleep)
             display_day_of_week_variability(daily_sleep)
@@ -272,7 +283,7 @@ try:
         except Exception as e:
             st.error(f"Error in advanced analytics: {str(e)}")
 
-    with tab4:
+    elif active_view == views[3]:
         
         try:
             quality_df, quality_metrics = get_quality_analysis_data(df)
@@ -289,7 +300,8 @@ try:
                     # Create line chart for selected metrics over time
                     fig_quality = px.line(quality_df, x='Date', y=selected_metrics,
                                           title='Sleep Quality Metrics Over Time',
-                                          labels={'value': 'Metric Value', 'variable': 'Metric'})
+                                          labels={'value': 'Metric Value', 'variable': 'Metric'},
+                                          render_mode='webgl')
                     st.plotly_chart(fig_quality, use_container_width=True)
                 else:
                     st.info("Select one or more quality metrics to visualize.")
@@ -298,7 +310,7 @@ try:
         except Exception as e:
             st.error(f"Error analyzing sleep quality: {str(e)}")
             
-    with tab5:
+    elif active_view == views[4]:
         
         try:
             overview_info = get_data_overview_info(df)
@@ -321,10 +333,8 @@ try:
             
             # Column information
             if 'columns' in overview_info:
-                columns_df = pd.DataFrame({
-                    'Column': overview_info['columns'],
-                    'Type': [str(df[col].dtype) for col in overview_info['columns']]
-                })
+                dtypes = df.dtypes.astype(str)
+                columns_df = dtypes.loc[overview_info['columns']].rename_axis('Column').reset_index(name='Type')
                 st.dataframe(columns_df, use_container_width=True)
 
             st.dataframe(df.head(10))
@@ -339,7 +349,7 @@ try:
         except Exception as e:
             st.error(f"Error displaying data overview: {str(e)}")
 
-    with tab6:
+    elif active_view == views[5]:
         
         # Display file loading info
         file_info = st.session_state.get('file_info', {})
@@ -372,8 +382,9 @@ with st.sidebar:
         if st.button("🔄 Sync from Google Drive"):
             sync_success = sync_from_gdrive()
             if sync_success:
-                # Clear caches and rerun to reflect new data
-                st.cache_data.clear()
+                # Clear data and processing caches and rerun to reflect new data
+                clear_data_cache()
+                clear_processing_cache()
                 st.rerun()
 
     st.header("📁 Data Source")
@@ -385,16 +396,15 @@ with st.sidebar:
         st.success(f"🎯 **Auto-selected:** {file_name}")
         
         # Show available files
-        data_folder = Path("data")
-        available_files = list(data_folder.glob("sleep-export*.csv"))
+        available_files = list_data_files("sleep-export*.csv")
         if len(available_files) > 1:
             st.write("**Available data files:**")
-            for file in sorted(available_files, key=lambda x: x.stat().st_mtime, reverse=True):
-                is_current = str(file) == current_file
+            for path, size_bytes, mtime in available_files:
+                is_current = path == current_file
                 icon = "🎯" if is_current else "📄"
-                size_mb = file.stat().st_size / (1024 * 1024)
-                mod_time = datetime.fromtimestamp(file.stat().st_mtime).strftime('%m/%d')
-                st.write(f"{icon} {file.name} ({size_mb:.1f}MB, {mod_time})")
+                size_mb = size_bytes / (1024 * 1024)
+                mod_time = datetime.fromtimestamp(mtime).strftime('%m/%d')
+                st.write(f"{icon} {Path(path).name} ({size_mb:.1f}MB, {mod_time})")
     
     # Add file uploader for alternative CSV files
     st.write("**Upload different file:**")
@@ -416,26 +426,24 @@ with st.sidebar:
     
     # Show data refresh options
     if st.button("🔄 Refresh Data"):
-        st.cache_data.clear()
+        clear_data_cache()
+        clear_processing_cache()
         st.rerun()
     
     try:
         if 'df' in locals() and len(df) > 0:
-            st.markdown("### 📊 Data Info")
-            st.write(f"**Records:** {len(df):,}")
-            
-            # Find date columns
-            date_cols = [col for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])]
-            
-            if date_cols:
-                main_date_col = date_cols[0]
-                min_date = df[main_date_col].min().date()
-                max_date = df[main_date_col].max().date()
-                total_days = (max_date - min_date).days + 1
+            sidebar_stats = get_sidebar_stats(df)
+            with st.expander("📊 Data Info", expanded=False):
+                info_lines = [f"**Records:** {sidebar_stats['records']:,}"]
                 
-                st.write(f"**Date range:** {min_date} to {max_date}")
-                st.write(f"**Total days:** {total_days}")
-                st.write(f"**Tracking rate:** {len(df)/total_days:.1%}")
+                date_range = sidebar_stats['date_range']
+                if date_range:
+                    info_lines += [
+                        f"**Date range:** {date_range['start']} to {date_range['end']}",
+                        f"**Total days:** {date_range['total_days']}",
+                        f"**Tracking rate:** {date_range['tracking_rate']:.1%}",
+                    ]
+                st.markdown("  \n".join(info_lines))
                 
     except:
         st.write("Data info will appear after successful load.")
@@ -459,12 +467,12 @@ with st.sidebar:
     
     # Check if data has timezone info
     if 'df' in locals() and len(df) > 0 and 'Tz' in df.columns:
-        # Show current timezone distribution
-        unique_timezones = df['Tz'].value_counts()
-        if len(unique_timezones) > 0:
-            st.write("**Timezones in your data:**")
-            for tz, count in unique_timezones.head(3).items():
-                st.write(f"• {tz}: {count} records")
+        # Show current timezone distribution (cached alongside the Data Info figures)
+        top_timezones = get_sidebar_stats(df)['top_timezones']
+        if len(top_timezones) > 0:
+            st.markdown("  \n".join(
+                ["**Timezones in your data:**"] + [f"• {tz}: {count} records" for tz, count in top_timezones.items()]
+            ))
         
         # Let user select target timezone
         current_tz = st.session_state.get('target_timezone', 'America/Chicago')
@@ -483,7 +491,7 @@ with st.sidebar:
         # Update session state if timezone changed
         if target_timezone != st.session_state.get('target_timezone'):
             st.session_state.target_timezone = target_timezone
-            st.cache_data.clear()  # Clear cache to force reload with new timezone
+            # Cached data and processing results do not depend on the display timezone
             st.rerun()
         
         # Note about timezone processing
@@ -495,9 +503,11 @@ with st.sidebar:
     
     st.markdown("---")
     st.markdown("### ℹ️ About")
-    st.markdown("This dashboard analyzes your 2025 sleep data from Sleep as Android exports.")
-    st.markdown("**Features:**")
-    st.markdown("- 📊 Sleep duration tracking")
-    st.markdown("- 🎯 Sleep quality metrics")  
-    st.markdown("- 📅 Sleep pattern analysis")
-    st.markdown("- 🔧 Data troubleshooting tools")
+    st.markdown(
+        "This dashboard analyzes your 2025 sleep data from Sleep as Android exports.\n\n"
+        "**Features:**\n"
+        "- 📊 Sleep duration tracking\n"
+        "- 🎯 Sleep quality metrics\n"
+        "- 📅 Sleep pattern analysis\n"
+        "- 🔧 Data troubleshooting tools"
+    )
@@ -9,7 +9,70 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 
-@st.cache_data
+from .config import DAY_ORDER, FIGURE_CACHE_ENTRIES
+from .data_processor import _DF_HASH, _slot_metadata
+
+# Fixed masks over the 96 fifteen-minute slots of the polar plots, built once at import
+_NIGHT_SLOT_MASK = np.zeros(96, dtype=bool)
+_NIGHT_SLOT_MASK[:33] = True   # 08:00 and earlier (32 * 15min = 480min = 08:00)
+_NIGHT_SLOT_MASK[84:] = True   # 21:00 and later (84 * 15min = 1260min = 21:00)
+_NAP_SLOT_MASK = np.zeros(96, dtype=bool)
+_NAP_SLOT_MASK[10 * 4:19 * 4 + 1] = True  # 10am (slot 40) to 7pm (slot 76)
+
+# Angular-axis hour ticks for the polar plots (every 15 degrees = every hour)
+_HOUR_TICKS = list(range(0, 360, 15))
+_HOUR_LABELS = [f"{i//15:02d}:00" for i in _HOUR_TICKS]
+
+def rolling_mean(values, window):
+    """
+    Trailing mean over `window` points from a running sum, O(n) for any window.
+    Positions without a full window of valid values are NaN, matching
+    pandas' rolling(window, min_periods=window).mean().
+    """
+    values = np.asarray(values, dtype=float)
+    out = np.full(values.shape, np.nan)
+    if len(values) < window:
+        return out
+    
+    valid = ~np.isnan(values)
+    running_sum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    running_count = np.concatenate(([0], np.cumsum(valid)))
+    window_sum = running_sum[window:] - running_sum[:-window]
+    full_window = (running_count[window:] - running_count[:-window]) == window
+    out[window - 1:] = np.where(full_window, window_sum / window, np.nan)
+    return out
+
+def rolling_stats(values, window):
+    """
+    Trailing mean, sample variance and standard deviation over `window` points,
+    all from one pass of running sums (sum and sum of squares).
+    NaN handling matches pandas' rolling(window, min_periods=window).
+    """
+    values = np.asarray(values, dtype=float)
+    mean = np.full(values.shape, np.nan)
+    var = np.full(values.shape, np.nan)
+    if len(values) < window:
+        return mean, var, np.sqrt(var)
+    
+    # Centre on the overall mean so the sum of squares stays small and precise
+    valid = ~np.isnan(values)
+    shift = values[valid].mean() if valid.any() else 0.0
+    centered = np.where(valid, values - shift, 0.0)
+    running_sum = np.concatenate(([0.0], np.cumsum(centered)))
+    running_sq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+    running_count = np.concatenate(([0], np.cumsum(valid)))
+    
+    window_sum = running_sum[window:] - running_sum[:-window]
+    window_sq = running_sq[window:] - running_sq[:-window]
+    full_window = (running_count[window:] - running_count[:-window]) == window
+    
+    mean[window - 1:] = np.where(full_window, window_sum / window + shift, np.nan)
+    if window > 1:
+        window_var = np.maximum((window_sq - window_sum * window_sum / window) / (window - 1), 0.0)
+        var[window - 1:] = np.where(full_window, window_var, np.nan)
+    return mean, var, np.sqrt(var)
+
+@st.cache_data(hash_funcs=_DF_HASH)
 def calculate_moving_variance(daily_sleep, window_days=10):
     """
     Calculate 10-day moving variance analysis to track sleep consistency trends
@@ -17,20 +80,21 @@ def calculate_moving_variance(daily_sleep, window_days=10):
     if len(daily_sleep) < window_days:
         return None
     
-    # Sort by date
-    df_sorted = daily_sleep.sort_values('Date').copy()
+    # Sort by date (only the two columns the rolling stats need; sort_values already returns a new frame)
+    df_sorted = daily_sleep[['Date', 'Hours']].sort_values('Date')
     
-    # Calculate rolling variance
-    df_sorted['Moving_Variance'] = df_sorted['Hours'].rolling(window=window_days, min_periods=window_days).var()
-    df_sorted['Moving_StdDev'] = df_sorted['Hours'].rolling(window=window_days, min_periods=window_days).std()
-    df_sorted['Moving_Average'] = df_sorted['Hours'].rolling(window=window_days, min_periods=window_days).mean()
+    # Calculate rolling mean, variance and standard deviation in a single pass
+    moving_avg, moving_var, moving_std = rolling_stats(df_sorted['Hours'].to_numpy(), window_days)
+    df_sorted['Moving_Variance'] = moving_var
+    df_sorted['Moving_StdDev'] = moving_std
+    df_sorted['Moving_Average'] = moving_avg
     
     # Remove rows without variance calculation
-    df_variance = df_sorted.dropna(subset=['Moving_Variance']).copy()
+    df_variance = df_sorted.dropna(subset=['Moving_Variance'])
     
     return df_variance
 
-@st.cache_data
+@st.cache_data(hash_funcs=_DF_HASH)
 def detect_extreme_outliers(daily_sleep, plot_df, n_outliers=10):
     """
     Detect the 10 most unusual sleep periods with detailed analysis
@@ -38,43 +102,57 @@ def detect_extreme_outliers(daily_sleep, plot_df, n_outliers=10):
     if len(daily_sleep) == 0:
         return None, None
     
-    # Calculate statistics for outlier detection
-    mean_sleep = daily_sleep['Hours'].mean()
-    std_sleep = daily_sleep['Hours'].std()
-    
-    # Calculate z-scores for daily totals
-    daily_sleep = daily_sleep.copy()
-    daily_sleep['Z_Score'] = abs((daily_sleep['Hours'] - mean_sleep) / std_sleep)
-    daily_sleep['Deviation_Hours'] = abs(daily_sleep['Hours'] - mean_sleep)
-    
-    # Get top outliers by z-score
-    top_outliers = daily_sleep.nlargest(n_outliers, 'Z_Score').copy()
+    # Calculate z-scores for daily totals on the raw array
+    hours = daily_sleep['Hours'].to_numpy(dtype=float)
+    mean_sleep = np.nanmean(hours)
+    std_sleep = np.nanstd(hours, ddof=1) if len(hours) > 1 else np.nan
+    deviation = np.abs(hours - mean_sleep)
+    z_scores = deviation / std_sleep
+    
+    # Get top outliers by z-score (partial selection, then sort only the top N)
+    ranked = np.flatnonzero(~np.isnan(z_scores))
+    n_top = min(n_outliers, len(ranked))
+    if n_top == 0:
+        return daily_sleep.iloc[:0].assign(Z_Score=[], Deviation_Hours=[]), []
+    top_idx = ranked[np.argpartition(-z_scores[ranked], n_top - 1)[:n_top]]
+    top_idx = top_idx[np.argsort(-z_scores[top_idx], kind='stable')]
+    
+    # Only the selected rows are materialised, with their scores attached
+    top_outliers = daily_sleep.iloc[top_idx].assign(Z_Score=z_scores[top_idx], Deviation_Hours=deviation[top_idx])
+    
+    # Gather the sessions of all outlier days in one pass, longest session first
+    session_dates = pd.to_datetime(plot_df['Date'])
+    in_outliers = session_dates.isin(top_outliers['Date']).to_numpy()
+    sessions = plot_df.loc[in_outliers, ['From', 'To', 'Hours']].assign(Date=session_dates[in_outliers])
+    sessions = sessions.sort_values(['Date', 'Hours'], ascending=[True, False])
+    sessions_by_date = dict(tuple(sessions.groupby('Date', sort=False)))
     
     # Get detailed session information for these outlier days
     outlier_details = []
-    for _, outlier_day in top_outliers.iterrows():
-        date = outlier_day['Date']
-        day_sessions = plot_df[plot_df['Date'] == date].copy()
+    for date, total_hours, z_score, deviation_hours in zip(
+        top_outliers['Date'], top_outliers['Hours'], top_outliers['Z_Score'], top_outliers['Deviation_Hours']
+    ):
+        day_sessions = sessions_by_date.get(date)
+        if day_sessions is None:
+            continue
         
-        if len(day_sessions) > 0:
-            # Sort by hours descending to show longest session first
-            day_sessions = day_sessions.sort_values('Hours', ascending=False)
-            
-            outlier_info = {
-                'Date': date,
-                'Total_Hours': outlier_day['Hours'],
-                'Z_Score': outlier_day['Z_Score'],
-                'Deviation_Hours': outlier_day['Deviation_Hours'],
-                'Session_Count': len(day_sessions),
-                'Longest_Session': day_sessions.iloc[0]['Hours'] if len(day_sessions) > 0 else 0,
-                'Sessions': day_sessions[['From', 'To', 'Hours']].to_dict('records'),
-                'Day_of_Week': date.strftime('%A') if hasattr(date, 'strftime') else 'Unknown'
-            }
-            outlier_details.append(outlier_info)
+        session_hours = day_sessions['Hours'].tolist()
+        outlier_details.append({
+            'Date': date,
+            'Total_Hours': total_hours,
+            'Z_Score': z_score,
+            'Deviation_Hours': deviation_hours,
+            'Session_Count': len(session_hours),
+            'Longest_Session': session_hours[0],
+            'Sessions_From': day_sessions['From'].tolist(),
+            'Sessions_To': day_sessions['To'].tolist(),
+            'Sessions_Hours': session_hours,
+            'Day_of_Week': date.strftime('%A') if hasattr(date, 'strftime') else 'Unknown'
+        })
     
     return top_outliers, outlier_details
 
-@st.cache_data
+@st.cache_data(hash_funcs=_DF_HASH)
 def analyze_recording_frequency(daily_sleep, plot_df):
     """
     Analyze recording frequency and identify gaps in sleep data
@@ -88,50 +166,32 @@ def analyze_recording_frequency(daily_sleep, plot_df):
     
     # Create complete date range
     date_range = pd.date_range(start=min_date, end=max_date, freq='D')
-    complete_dates = pd.DataFrame({'Date': date_range})
     
-    # Merge with actual data to find gaps
-    merged = complete_dates.merge(daily_sleep[['Date', 'Hours']], on='Date', how='left')
-    merged['Has_Data'] = merged['Hours'].notna()
+    # Reindex daily totals onto the full range; missing days come back as NaN
+    daily_hours = daily_sleep.set_index('Date')['Hours'].reindex(date_range)
     
     # Identify gaps
-    gaps = merged[~merged['Has_Data']].copy()
+    is_gap = daily_hours.isna().to_numpy().astype(np.int8)
     
     # Calculate gap statistics
-    total_days = len(complete_dates)
+    total_days = len(date_range)
     recorded_days = len(daily_sleep)
-    missing_days = len(gaps)
+    missing_days = int(is_gap.sum())
     recording_rate = (recorded_days / total_days) * 100
     
-    # Find consecutive gap periods
-    gap_periods = []
-    if len(gaps) > 0:
-        gaps['Date_Diff'] = gaps['Date'].diff().dt.days
-        gap_start = None
-        
-        for idx, row in gaps.iterrows():
-            if gap_start is None or row['Date_Diff'] > 1:
-                # Start of new gap period
-                if gap_start is not None:
-                    # End previous gap period
-                    gap_periods.append({
-                        'Start': gap_start,
-                        'End': prev_date,
-                        'Duration_Days': (prev_date - gap_start).days + 1
-                    })
-                gap_start = row['Date']
-            prev_date = row['Date']
-        
-        # Don't forget the last gap period
-        if gap_start is not None:
-            gap_periods.append({
-                'Start': gap_start,
-                'End': prev_date,
-                'Duration_Days': (prev_date - gap_start).days + 1
-            })
+    # Find consecutive gap periods as runs of missing days (run-length encoding)
+    edges = np.diff(np.concatenate(([0], is_gap, [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1) - 1
+    all_dates = date_range.to_numpy()
+    gap_periods = pd.DataFrame({
+        'Start': all_dates[run_starts],
+        'End': all_dates[run_ends],
+        'Duration_Days': run_ends - run_starts + 1
+    })
     
     # Sessions per day analysis
-    session_counts = plot_df.groupby('Date').size().reset_index(name='Session_Count')
+    session_counts = plot_df['Date'].value_counts(sort=False).rename_axis('Date').reset_index(name='Session_Count')
     session_stats = session_counts['Session_Count'].describe()
     
     frequency_stats = {
@@ -147,7 +207,7 @@ def analyze_recording_frequency(daily_sleep, plot_df):
     
     return frequency_stats
 
-@st.cache_data
+@st.cache_data(hash_funcs=_DF_HASH)
 def calculate_day_of_week_variability(daily_sleep):
     """
     Calculate variability (in hours) per day of week
@@ -155,47 +215,32 @@ def calculate_day_of_week_variability(daily_sleep):
     if len(daily_sleep) == 0:
         return None
     
-    # Add day of week
-    daily_sleep_copy = daily_sleep.copy()
-    daily_sleep_copy['Day_of_Week'] = daily_sleep_copy['Date'].dt.day_name()
+    # Day of week is precomputed as an ordered categorical by get_duration_analysis_data
+    day_of_week = daily_sleep['Day_of_Week'] if 'Day_of_Week' in daily_sleep.columns else pd.Categorical.from_codes(
+        daily_sleep['Date'].dt.dayofweek, categories=DAY_ORDER, ordered=True)
     
-    # Define proper order
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    
-    # Calculate statistics per day of week
-    day_stats = daily_sleep_copy.groupby('Day_of_Week')['Hours'].agg([
+    # Calculate statistics per day of week (categorical groupby is already in Monday-Sunday order)
+    day_stats = daily_sleep['Hours'].groupby(day_of_week, observed=True).agg([
         'count', 'mean', 'std', 'min', 'max', 'median'
-    ]).reset_index()
+    ]).rename_axis('Day_of_Week').reset_index()
     
     # Calculate additional variability metrics
     day_stats['Range'] = day_stats['max'] - day_stats['min']
     day_stats['Coefficient_of_Variation'] = (day_stats['std'] / day_stats['mean']) * 100
     
-    # Ensure proper ordering
-    day_stats['Day_of_Week'] = pd.Categorical(day_stats['Day_of_Week'], categories=day_order, ordered=True)
-    day_stats = day_stats.sort_values('Day_of_Week')
-    
     # Fill NaN values for days with only one data point
-    day_stats['std'] = day_stats['std'].fillna(0)
-    day_stats['Range'] = day_stats['Range'].fillna(0)
-    day_stats['Coefficient_of_Variation'] = day_stats['Coefficient_of_Variation'].fillna(0)
+    day_stats = day_stats.fillna({'std': 0, 'Range': 0, 'Coefficient_of_Variation': 0})
     
     return day_stats
 
-def display_moving_variance_analysis(daily_sleep):
-    """Display 10-day moving variance analysis"""
-    
-    variance_data = calculate_moving_variance(daily_sleep)
-    
-    if variance_data is None or len(variance_data) == 0:
-        st.warning("Not enough data for 10-day moving variance analysis (minimum 10 days required)")
-        return
-    
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_variance_figure(variance_data):
+    """Build the moving-variance trend chart; reused across reruns while the data is unchanged."""
     # Create the variance trend chart
     fig = go.Figure()
     
     # Add variance line
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=variance_data['Date'],
         y=variance_data['Moving_Variance'],
         mode='lines',
@@ -214,8 +259,20 @@ def display_moving_variance_analysis(daily_sleep):
         yaxis_title='Variance (hours²)',
         hovermode='x unified'
     )
+    return fig
+
+def display_moving_variance_analysis(daily_sleep):
+    """Display 10-day moving variance analysis"""
     
-    st.plotly_chart(fig, use_container_width=True)
+    variance_data = calculate_moving_variance(daily_sleep)
+    
+    if variance_data is None or len(variance_data) == 0:
+        st.warning("Not enough data for 10-day moving variance analysis (minimum 10 days required)")
+        return
+    
+    st.plotly_chart(build_variance_figure(variance_data), use_container_width=True)
+    
+    avg_variance = variance_data['Moving_Variance'].mean()
     
     # Display insights
     col1, col2, col3 = st.columns(3)
@@ -267,10 +324,11 @@ def display_extreme_outliers(daily_sleep, plot_df):
             
             with col2:
                 st.write("**Sleep Sessions:**")
-                for j, session in enumerate(outlier['Sessions'], 1):
-                    from_time = session['From'].strftime('%H:%M') if hasattr(session['From'], 'strftime') else str(session['From'])
-                    to_time = session['To'].strftime('%H:%M') if hasattr(session['To'], 'strftime') else str(session['To'])
-                    st.write(f"Session {j}: {from_time} → {to_time} ({session['Hours']:.1f}h)")
+                sessions = zip(outlier['Sessions_From'], outlier['Sessions_To'], outlier['Sessions_Hours'])
+                for j, (start, end, hours) in enumerate(sessions, 1):
+                    from_time = start.strftime('%H:%M') if hasattr(start, 'strftime') else str(start)
+                    to_time = end.strftime('%H:%M') if hasattr(end, 'strftime') else str(end)
+                    st.write(f"Session {j}: {from_time} → {to_time} ({hours:.1f}h)")
 
 def display_recording_frequency(daily_sleep, plot_df):
     """Display recording frequency analysis"""
@@ -297,11 +355,12 @@ def display_recording_frequency(daily_sleep, plot_df):
         st.metric("Recording Rate", f"{freq_stats['recording_rate_percent']:.1f}%")
     
     # Gap analysis
-    if freq_stats['gap_periods']:
+    if len(freq_stats['gap_periods']) > 0:
         st.write("**Data Gaps Identified:**")
-        gap_df = pd.DataFrame(freq_stats['gap_periods'])
-        gap_df['Start'] = gap_df['Start'].dt.strftime('%Y-%m-%d')
-        gap_df['End'] = gap_df['End'].dt.strftime('%Y-%m-%d')
+        gap_df = freq_stats['gap_periods'].assign(
+            Start=freq_stats['gap_periods']['Start'].dt.strftime('%Y-%m-%d'),
+            End=freq_stats['gap_periods']['End'].dt.strftime('%Y-%m-%d')
+        )
         st.dataframe(gap_df, column_config={
             "Start": "Gap Start",
             "End": "Gap End", 
@@ -332,6 +391,18 @@ def display_recording_frequency(daily_sleep, plot_df):
         multi_session_days = len(session_counts[session_counts['Session_Count'] > 1])
         st.metric("Days with Multiple Sessions", f"{multi_session_days}")
 
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_day_of_week_figure(day_stats):
+    """Build the per-weekday variability bar chart; reused across reruns while the stats are unchanged."""
+    # Create variability chart
+    fig = px.bar(day_stats, x='Day_of_Week', y='std',
+                title='Sleep Duration Variability by Day of Week',
+                labels={'std': 'Standard Deviation (hours)', 'Day_of_Week': 'Day of Week'})
+    
+    # Add text annotations showing the exact values
+    fig.update_traces(text=[f"{val:.1f}h" for val in day_stats['std']], textposition='outside')
+    return fig
+
 def display_day_of_week_variability(daily_sleep):
     """Display day of week variability analysis"""
     
@@ -341,21 +412,12 @@ def display_day_of_week_variability(daily_sleep):
         st.warning("No data available for day-of-week analysis")
         return
     
-    # Create variability chart
-    fig = px.bar(day_stats, x='Day_of_Week', y='std',
-                title='Sleep Duration Variability by Day of Week',
-                labels={'std': 'Standard Deviation (hours)', 'Day_of_Week': 'Day of Week'})
-    
-    # Add text annotations showing the exact values
-    fig.update_traces(text=[f"{val:.1f}h" for val in day_stats['std']], textposition='outside')
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_day_of_week_figure(day_stats), use_container_width=True)
     
     # Display detailed statistics table
     st.write("**Detailed Variability Statistics:**")
     
-    display_stats = day_stats.copy()
-    display_stats = display_stats.round(1)
+    display_stats = day_stats.round(1)
     
     st.dataframe(display_stats, column_config={
         "Day_of_Week": "Day",
@@ -380,46 +442,27 @@ def display_day_of_week_variability(daily_sleep):
     with col2:
         st.success(f"**Most Consistent:** {most_consistent_day} ({day_stats['std'].min():.1f}h variability)")
 
-def display_sleep_time_polar_plot(df):
-    """Display 24-hour sleep distribution as a polar plot"""
-    
-    from .data_processor import get_sleep_time_distribution_data
-    
-    time_dist_data = get_sleep_time_distribution_data(df, interval_minutes=15)
-    
-    if time_dist_data is None or len(time_dist_data) == 0:
-        st.warning("No data available for 24-hour sleep distribution analysis")
-        return
-    
-    # Filter out time slots with no sleep (optional - can be removed for complete visualization)
-    # time_dist_data = time_dist_data[time_dist_data['total_hours'] > 0]
-    
-    if len(time_dist_data) == 0:
-        st.info("No sleep time distribution data to display")
-        return
-    
-    # Create polar plot
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_polar_figure(slot_hours, interval_minutes, radial_max, radial_dtick, line_color, fill_color):
+    """
+    Build the 24-hour polar plot shared by the full-day and nap views.
+    Cached as a resource so reruns with unchanged slot data reuse the same figure;
+    labels and angles come from the slot interval so the cache key stays hashable.
+    """
+    _, slot_labels, slot_degrees = _slot_metadata(interval_minutes)
     fig = go.Figure(go.Scatterpolar(
-        r=time_dist_data['total_hours'],
-        theta=time_dist_data['degrees'],
+        r=slot_hours,
+        theta=slot_degrees,
         mode='lines+markers',
         fill='toself',
         name='Sleep Hours',
-        line=dict(color='rgba(135, 206, 250, 0.9)', width=2),  # Light blue line
-        fillcolor='rgba(100, 149, 237, 0.4)',  # Cornflower blue fill
-        marker=dict(size=4, color='rgba(135, 206, 250, 0.9)'),
+        line=dict(color=line_color, width=2),
+        fillcolor=fill_color,
+        marker=dict(size=4, color=line_color),
         hovertemplate='<b>Time:</b> %{customdata}<br><b>Total Sleep:</b> %{r:.1f} hours<extra></extra>',
-        customdata=time_dist_data['time_label']
+        customdata=slot_labels
     ))
     
-    # Calculate max hours for radial axis range
-    max_hours = time_dist_data['total_hours'].max() if len(time_dist_data) > 0 else 1
-    radial_max = max(max_hours * 1.1, 1)  # Add 10% padding, minimum 1 hour
-    
-    # Create time labels for angular axis (every hour)
-    hour_ticks = list(range(0, 360, 15))  # Every 15 degrees = every hour
-    hour_labels = [f"{i//15:02d}:00" for i in hour_ticks]
-    
     fig.update_layout(
         polar=dict(
             radialaxis=dict(
@@ -427,15 +470,15 @@ def display_sleep_time_polar_plot(df):
                 range=[0, radial_max],
                 tickmode='linear',
                 tick0=0,
-                dtick=max(1, radial_max//5),  # About 5 tick marks
+                dtick=radial_dtick,
                 title_font=dict(color='white'),
                 tickfont=dict(color='white'),
                 gridcolor='rgba(255, 255, 255, 0.3)'
             ),
             angularaxis=dict(
                 tickmode='array',
-                tickvals=hour_ticks,
-                ticktext=hour_labels,
+                tickvals=_HOUR_TICKS,
+                ticktext=_HOUR_LABELS,
                 direction='clockwise',
                 rotation=90,  # Start at top (midnight)
                 showgrid=True,
@@ -452,18 +495,46 @@ def display_sleep_time_polar_plot(df):
         paper_bgcolor='#0E1117',
         plot_bgcolor='#0E1117'
     )
+    return fig
+
+def display_sleep_time_polar_plot(df):
+    """Display 24-hour sleep distribution as a polar plot"""
+    
+    from .data_processor import get_sleep_time_distribution_data
+    
+    time_dist_data = get_sleep_time_distribution_data(df, interval_minutes=15)
+    
+    if time_dist_data is None or len(time_dist_data) == 0:
+        st.warning("No data available for 24-hour sleep distribution analysis")
+        return
+    
+    # Filter out time slots with no sleep (optional - can be removed for complete visualization)
+    # time_dist_data = time_dist_data[time_dist_data['total_hours'] > 0]
+    
+    if len(time_dist_data) == 0:
+        st.info("No sleep time distribution data to display")
+        return
     
+    # Plain arrays for the trace; the distribution itself is cached and shared by both polar views
+    slot_hours = time_dist_data['total_hours'].to_numpy()
+    
+    # Calculate max hours for radial axis range
+    max_hours = slot_hours.max() if len(slot_hours) > 0 else 1
+    radial_max = max(max_hours * 1.1, 1)  # Add 10% padding, minimum 1 hour
+    
+    fig = build_polar_figure(
+        slot_hours, interval_minutes=15,
+        radial_max=radial_max,
+        radial_dtick=max(1, radial_max//5),  # About 5 tick marks
+        line_color='rgba(135, 206, 250, 0.9)',  # Light blue line
+        fill_color='rgba(100, 149, 237, 0.4)'  # Cornflower blue fill
+    )
     st.plotly_chart(fig, use_container_width=False)
     
     # Additional insights (keeping only the nighttime/daytime distribution)
-    time_dist_data = get_sleep_time_distribution_data(df, interval_minutes=15)
     if len(time_dist_data) > 0:
-        total_sleep_hours = time_dist_data['total_hours'].sum()
-        
-        nighttime_hours = time_dist_data[
-            (time_dist_data['time_slot'] >= 84) |  # 21:00 and later (84 * 15min = 1260min = 21:00)  
-            (time_dist_data['time_slot'] <= 32)    # 08:00 and earlier (32 * 15min = 480min = 08:00)
-        ]['total_hours'].sum()
+        total_sleep_hours = slot_hours.sum()
+        nighttime_hours = slot_hours[_NIGHT_SLOT_MASK[time_dist_data['time_slot'].to_numpy()]].sum()
         
         if total_sleep_hours > 0:
             nighttime_percentage = (nighttime_hours / total_sleep_hours) * 100
@@ -484,80 +555,33 @@ def display_sleep_time_polar_plot_nap_view(df):
         st.info("No sleep time distribution data to display for nap view")
         return
     
-    # Calculate daytime range (10am to 7pm)
-    # 10:00 AM = slot 40 (10 * 4 slots per hour)
-    # 7:00 PM = slot 76 (19 * 4 slots per hour) 
-    daytime_start_slot = 10 * 4  # 10am
-    daytime_end_slot = 19 * 4    # 7pm
+    # Plain arrays for the trace; the distribution itself is cached and shared by both polar views
+    slot_hours = time_dist_data['total_hours'].to_numpy()
+    slot_labels = time_dist_data['time_label'].to_numpy()
     
-    # Find maximum sleep value in daytime range for scaling
-    daytime_data = time_dist_data[
-        (time_dist_data['time_slot'] >= daytime_start_slot) & 
-        (time_dist_data['time_slot'] <= daytime_end_slot)
-    ]
+    # Find maximum sleep value in daytime range (10am to 7pm) for scaling
+    daytime_slots = np.flatnonzero(_NAP_SLOT_MASK[time_dist_data['time_slot'].to_numpy()])
+    daytime_hours = slot_hours[daytime_slots]
     
-    if len(daytime_data) == 0 or daytime_data['total_hours'].max() == 0:
+    if len(daytime_hours) == 0 or daytime_hours.max() == 0:
         st.info("No daytime sleep detected for nap view (10am-7pm range)")
         return
     
-    daytime_max = daytime_data['total_hours'].max()
+    daytime_max = daytime_hours.max()
     radial_max = max(daytime_max * 1.2, 0.1)  # Add 20% padding, minimum 0.1 hour
     
     # Create polar plot with daytime scaling
-    fig = go.Figure(go.Scatterpolar(
-        r=time_dist_data['total_hours'],
-        theta=time_dist_data['degrees'],
-        mode='lines+markers',
-        fill='toself',
-        name='Sleep Hours',
-        line=dict(color='rgba(255, 165, 0, 0.9)', width=2),  # Orange line for nap view
-        fillcolor='rgba(255, 140, 0, 0.4)',  # Dark orange fill
-        marker=dict(size=4, color='rgba(255, 165, 0, 0.9)'),
-        hovertemplate='<b>Time:</b> %{customdata}<br><b>Total Sleep:</b> %{r:.1f} hours<extra></extra>',
-        customdata=time_dist_data['time_label']
-    ))
-    
-    # Create time labels for angular axis (every hour)
-    hour_ticks = list(range(0, 360, 15))  # Every 15 degrees = every hour
-    hour_labels = [f"{i//15:02d}:00" for i in hour_ticks]
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                title="Total Hours Slept",
-                range=[0, radial_max],
-                tickmode='linear',
-                tick0=0,
-                dtick=max(0.05, radial_max//5),  # Smaller tick intervals for nap scale
-                title_font=dict(color='white'),
-                tickfont=dict(color='white'),
-                gridcolor='rgba(255, 255, 255, 0.3)'
-            ),
-            angularaxis=dict(
-                tickmode='array',
-                tickvals=hour_ticks,
-                ticktext=hour_labels,
-                direction='clockwise',
-                rotation=90,  # Start at top (midnight)
-                showgrid=True,
-                gridcolor='rgba(255, 255, 255, 0.3)',
-                gridwidth=1,
-                tickfont=dict(color='white', size=12)
-            ),
-            bgcolor='#0E1117'
-        ),
-        showlegend=False,
-        margin=dict(t=40, b=40, l=40, r=40),
-        height=910,
-        width=910,
-        paper_bgcolor='#0E1117',
-        plot_bgcolor='#0E1117'
+    fig = build_polar_figure(
+        slot_hours, interval_minutes=15,
+        radial_max=radial_max,
+        radial_dtick=max(0.05, radial_max//5),  # Smaller tick intervals for nap scale
+        line_color='rgba(255, 165, 0, 0.9)',  # Orange line for nap view
+        fill_color='rgba(255, 140, 0, 0.4)'  # Dark orange fill
     )
-    
     st.plotly_chart(fig, use_container_width=False)
     
     # Display nap-specific insights
-    total_daytime_hours = daytime_data['total_hours'].sum()
+    total_daytime_hours = daytime_hours.sum()
     if total_daytime_hours > 0:
-        peak_nap_slot = daytime_data.loc[daytime_data['total_hours'].idxmax()]
-        st.info(f"**Nap Insights:** Peak daytime sleep at {peak_nap_slot['time_label']} ({peak_nap_slot['total_hours']:.2f} hours). Total daytime sleep: {total_daytime_hours:.1f} hours") 
\ No newline at end of file
+        peak_nap_slot = daytime_slots[daytime_hours.argmax()]
+        st.info(f"**Nap Insights:** Peak daytime sleep at {slot_labels[peak_nap_slot]} ({slot_hours[peak_nap_slot]:.2f} hours). Total daytime sleep: {total_daytime_hours:.1f} hours") 
\ No newline at end of file
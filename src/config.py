@@ -125,6 +125,14 @@ BASIC_COLUMNS = ['Id', 'Tz', 'From', 'To', 'Sched', 'Hours', 'Rating', 'Comment'
 DATE_COLUMNS = ['From', 'To', 'Sched']
 NUMERIC_COLUMNS = ['Hours', 'Rating', 'Snore', 'Noise', 'Cycles', 'DeepSleep', 'LenAdjust']
 QUALITY_METRICS = ['DeepSleep', 'Cycles', 'Snore', 'Noise']
+# Storage dtypes for fractional columns; count columns are downcast to the smallest integer type
+NUMERIC_DTYPES = {
+    'Hours': 'float32',
+    'Rating': 'float32',
+    'Noise': 'float32',
+    'DeepSleep': 'float32',
+}
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
 # Timezone Constants
 DEFAULT_TIMEZONE = 'America/Chicago'
@@ -144,5 +152,8 @@ COMMON_TIMEZONES = [
 # Chart Configuration
 IDEAL_SLEEP_HOURS = 8
 MAX_REASONABLE_DAILY_SLEEP = 12
-CHART_HEIGHT = 400 
+CHART_HEIGHT = 400
+MAX_CHART_POINTS = 5000  # Longer time series are MinMax-decimated before plotting 
+FIGURE_CACHE_ENTRIES = 8  # Cached Plotly figures kept per builder; older ones are evicted
+FILE_SCAN_TTL = 60  # Seconds to reuse a data-folder scan before hitting the disk again
 
@@ -4,6 +4,10 @@ Data loading and file detection for the Sleep Data Dashboard
 import streamlit as st
 import pandas as pd
 import numpy as np
+import os
+import re
+import fnmatch
+import hashlib
 from pathlib import Path
 from datetime import datetime
 import pytz
@@ -23,13 +27,22 @@ from .config import (
     DEFAULT_TIMEZONE,
     ENABLE_GDRIVE_SYNC,
     ENABLE_DB,
+    FILE_SCAN_TTL,
 )
 
+# Columns kept when reading a CSV (Movement/Event columns are matched by name at read time)
+_NEEDED_COLUMNS = set(DATE_COLUMNS) | set(NUMERIC_COLUMNS) | set(BASIC_COLUMNS) | {'Tz'}
+
 # ---------------------------------------------------------------------------
 # Utility helpers
 # ---------------------------------------------------------------------------
 
 
+def _ensure_notifications() -> list:
+    """Return the session's notifications list, creating it on first use."""
+    return st.session_state.setdefault('notifications', [])
+
+
 def _coerce_datetime_columns(
     df: pd.DataFrame,
     *,
@@ -46,9 +59,14 @@ def _coerce_datetime_columns(
         from .config import DATE_COLUMNS as _DATE_COLS  # local import to avoid circularity
         date_columns = _DATE_COLS
 
-    for col in date_columns:
-        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
-            df[col] = pd.to_datetime(df[col], format=DATE_FORMAT, errors='coerce')
+    pending = [col for col in date_columns
+               if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col])]
+    if not pending:
+        # parse_dates already produced datetimes (the usual case)
+        return df
+
+    for col in pending:
+        df[col] = pd.to_datetime(df[col], format=DATE_FORMAT, errors='coerce')
     return df
 
 
@@ -56,40 +74,124 @@ def _coerce_numeric_columns(
     df: pd.DataFrame,
     numeric_columns: list | None = None,
 ) -> pd.DataFrame:
-    """Convert numeric columns to numeric dtype, coercing errors to NaN."""
+    """Convert numeric columns to numeric dtype, coercing errors to NaN.
+
+    Columns listed in NUMERIC_DTYPES are then stored in their compact dtype;
+    the rest are downcast to the smallest integer (or float) type that fits.
+    """
 
     if numeric_columns is None:
         from .config import NUMERIC_COLUMNS as _NUM_COLS
         numeric_columns = _NUM_COLS
+    from .config import NUMERIC_DTYPES as _NUM_DTYPES
 
     for col in numeric_columns:
         if col in df.columns:
             df[col] = pd.to_numeric(df[col], errors='coerce')
+            if col in _NUM_DTYPES:
+                df[col] = df[col].astype(_NUM_DTYPES[col])
+            elif pd.api.types.is_integer_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            else:
+                df[col] = pd.to_numeric(df[col], downcast='float')
     return df
 
+def _is_needed_column(name: str) -> bool:
+    """Whether a CSV column is used anywhere in the dashboard."""
+    return name in _NEEDED_COLUMNS or 'Movement' in name or 'Event' in name
+
+
+def _read_csv_header(source) -> list:
+    """Return the raw header fields of a CSV path or file-like object."""
+
+    if hasattr(source, 'readline'):
+        first_line = source.readline()
+        source.seek(0)
+        if isinstance(first_line, bytes):
+            first_line = first_line.decode('utf-8-sig')
+    else:
+        with open(source, newline='', encoding='utf-8-sig') as fh:
+            first_line = fh.readline()
+    return next(csv.reader([first_line]), [])
+
+
+def _read_sleep_csv(source) -> pd.DataFrame:
+    """Read a sleep-export CSV, preferring pyarrow's multithreaded parser.
+
+    Only the columns the dashboard uses are parsed; the per-minute actigraphy
+    columns are skipped. Repeated headers (e.g. Event) keep their first
+    occurrence. Falls back to the default C engine when pyarrow is not
+    installed or rejects the file (e.g. ragged rows).
+    """
+
+    usecols = list(dict.fromkeys(col for col in _read_csv_header(source) if _is_needed_column(col)))
+
+    try:
+        return pd.read_csv(source, engine='pyarrow', usecols=usecols,
+                           parse_dates=DATE_COLUMNS, date_format=DATE_FORMAT)
+    except (ImportError, ValueError):
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        # Paths on disk are memory-mapped instead of copied through a read buffer
+        return pd.read_csv(source, usecols=usecols, parse_dates=DATE_COLUMNS,
+                           dayfirst=True, date_format=DATE_FORMAT,
+                           memory_map=not hasattr(source, 'read'))
+
 # All top-level imports of local src modules are removed to prevent circular dependencies.
 
+# FILE_PATTERNS compiled once so the data folder can be classified in a single scan
+_FILE_PATTERN_REGEXES = [re.compile(fnmatch.translate(pattern)) for pattern in FILE_PATTERNS]
+
+@st.cache_data(ttl=FILE_SCAN_TTL, show_spinner=False)
 def find_latest_data_file():
     """
     Find the latest 2025-only data file in the data folder based on naming convention.
     New format: YYYYMMDD_sleep-export[_2025only].csv
     Returns the path to the most recent file.
     """
-    data_folder = Path(DATA_FOLDER)
+    try:
+        with os.scandir(DATA_FOLDER) as entries:
+            files = [entry for entry in entries if entry.is_file() and not entry.name.startswith('.')]
+    except FileNotFoundError:
+        return None
     
-    # Try each pattern in priority order
-    for pattern in FILE_PATTERNS:
-        files = list(data_folder.glob(pattern))
-        if files:
-            if pattern.startswith("*_sleep-export"):
-                # New format - sort by date in filename (YYYYMMDD at start)
-                latest_file = max(files, key=lambda x: x.name[:8])
-            else:
-                # Legacy format - sort by modification time
-                latest_file = max(files, key=lambda x: x.stat().st_mtime)
-            return str(latest_file)
+    # Bucket each file under the highest-priority pattern it matches (one pass over the folder)
+    buckets = {}
+    for entry in files:
+        for priority, regex in enumerate(_FILE_PATTERN_REGEXES):
+            if regex.match(entry.name):
+                buckets.setdefault(priority, []).append(entry)
+                break
+    
+    if not buckets:
+        return None
     
-    return None
+    # Use the files of the best pattern that matched anything
+    priority = min(buckets)
+    if FILE_PATTERNS[priority].startswith("*_sleep-export"):
+        # New format - sort by date in filename (YYYYMMDD at start)
+        latest_file = max(buckets[priority], key=lambda entry: entry.name[:8])
+    else:
+        # Legacy format - sort by modification time (DirEntry caches the stat result)
+        latest_file = max(buckets[priority], key=lambda entry: entry.stat().st_mtime)
+    return latest_file.path
+
+@st.cache_data(ttl=FILE_SCAN_TTL, show_spinner=False)
+def list_data_files(pattern):
+    """
+    List data files matching `pattern` in the data folder, newest first.
+    Returns (path, size_bytes, mtime) tuples from a single stat() per file.
+    """
+    entries = []
+    for file in Path(DATA_FOLDER).glob(pattern):
+        stat = file.stat()
+        entries.append((str(file), stat.st_size, stat.st_mtime))
+    return sorted(entries, key=lambda entry: entry[2], reverse=True)
+
+@st.cache_resource(show_spinner=False)
+def get_tz(name):
+    """Return the pytz timezone for `name`, constructed once per process."""
+    return pytz.timezone(name)
 
 def process_timezone_aware_dates(df, target_timezone=DEFAULT_TIMEZONE):
     """
@@ -102,71 +204,80 @@ def process_timezone_aware_dates(df, target_timezone=DEFAULT_TIMEZONE):
     Returns:
         DataFrame with timezone-aware and converted date columns
     """
+    notifications = _ensure_notifications()
+    
     if 'Tz' not in df.columns:
-        if 'notifications' not in st.session_state:
-            st.session_state.notifications = []
-        st.session_state.notifications.append("⚠️ No timezone information found in data. Times will be treated as naive datetimes.")
+        notifications.append("⚠️ No timezone information found in data. Times will be treated as naive datetimes.")
         return df
     
-    df_processed = df.copy()
+    # Shallow copy: only the rewritten date columns get new data, the rest is shared with df
+    df_processed = df.copy(deep=False)
     
     # Get the target timezone object
     try:
-        target_tz = pytz.timezone(target_timezone)
+        target_tz = get_tz(target_timezone)
     except Exception as e:
-        if 'notifications' not in st.session_state:
-            st.session_state.notifications = []
-        st.session_state.notifications.append(f"⚠️ Invalid target timezone '{target_timezone}'. Using UTC instead.")
+        notifications.append(f"⚠️ Invalid target timezone '{target_timezone}'. Using UTC instead.")
         target_tz = pytz.UTC
         target_timezone = 'UTC'
     
     successful_conversions = 0
     total_conversions = 0
     
+    # Rows are grouped by source timezone so each (timezone, column) pair is
+    # localized and converted with one vectorized call instead of per row. The
+    # groups are built once from integer codes (free when Tz is categorical)
+    # and reused for every date column.
+    tz_codes, tz_uniques = pd.factorize(df_processed['Tz'])
+    tz_order = np.argsort(tz_codes, kind='stable')
+    tz_bounds = np.searchsorted(tz_codes[tz_order], np.arange(len(tz_uniques) + 1))
+    tz_groups = [(tz_uniques[k], tz_order[tz_bounds[k]:tz_bounds[k + 1]]) for k in range(len(tz_uniques))]
+    
     for date_col in DATE_COLUMNS:
         if date_col in df_processed.columns:
-            # Process each row's date with its corresponding timezone
-            converted_dates = []
+            original = df_processed[date_col]
+            total_conversions += len(original)
             
-            for idx, row in df_processed.iterrows():
-                total_conversions += 1
+            has_value = original.notna().to_numpy()
+            converted = pd.Series(pd.NaT, index=df_processed.index, dtype=pd.DatetimeTZDtype(tz=target_tz))
+            is_converted = np.zeros(len(original), dtype=bool)
+            
+            for source_tz_str, tz_rows in tz_groups:
+                rows = tz_rows[has_value[tz_rows]]
+                if len(rows) == 0:
+                    continue
                 try:
-                    if pd.isna(row[date_col]) or pd.isna(row['Tz']):
-                        converted_dates.append(row[date_col])
-                        continue
-                    
-                    # Get the source timezone
-                    source_tz_str = row['Tz']
-                    source_tz = pytz.timezone(source_tz_str)
-                    
-                    # If the datetime is naive, localize it to the source timezone
-                    dt = row[date_col]
-                    if dt.tz is None:
-                        # Localize to source timezone
-                        dt_localized = source_tz.localize(dt)
-                    else:
-                        # Already timezone-aware, convert to source timezone if needed
-                        dt_localized = dt.astimezone(source_tz)
+                    source_tz = get_tz(source_tz_str)
+                    times = pd.DatetimeIndex(original.iloc[rows])
+                    if times.tz is None:
+                        # Localize to source timezone; repeated fall-back hours resolve to
+                        # daylight time and times in the spring-forward gap move ahead by
+                        # the DST offset (02:30 -> 03:30), as pytz's localize() did
+                        times = times.tz_localize(source_tz, ambiguous=np.ones(len(times), dtype=bool),
+                                                  nonexistent=pd.Timedelta('1h'))
                     
                     # Convert to target timezone
-                    dt_converted = dt_localized.astimezone(target_tz)
-                    converted_dates.append(dt_converted)
-                    successful_conversions += 1
-                    
+                    converted.iloc[rows] = times.tz_convert(target_tz)
+                    is_converted[rows] = True
                 except Exception as e:
-                    # If conversion fails, keep original value
-                    converted_dates.append(row[date_col])
+                    # If conversion fails, keep original values for this timezone
                     continue
             
-            # Update the column with converted dates
-            df_processed[date_col] = converted_dates
+            successful_conversions += int(is_converted.sum())
+            
+            # Update the column with converted dates; rows that could not be converted keep
+            # their original (naive) value, which leaves a mixed object column
+            if not is_converted.any():
+                continue
+            if is_converted.sum() == original.notna().sum():
+                df_processed[date_col] = converted
+            else:
+                df_processed[date_col] = converted.astype(object).where(is_converted, original.astype(object))
     
     # Store conversion statistics for notifications tab
     if total_conversions > 0:
         success_rate = (successful_conversions / total_conversions) * 100
-        if 'notifications' not in st.session_state:
-            st.session_state.notifications = []
-        st.session_state.notifications.append(f"🌍 Timezone Processing Complete\n"
+        notifications.append(f"🌍 Timezone Processing Complete\n"
                f"- Converted {successful_conversions}/{total_conversions} timestamps ({success_rate:.1f}% success rate)\n"
                f"- All times now displayed in {target_timezone}\n"
                f"- Original timezones preserved in 'Tz' column for reference")
@@ -192,6 +303,22 @@ def assign_sleep_date(row):
     else:
         return start_date
 
+def assign_sleep_dates(df):
+    """
+    Vectorized assign_sleep_date for a whole DataFrame.
+    
+    A period that spans midnight goes to its wake-up date and one that does
+    not starts and ends on that same date, so the assigned date is always
+    the calendar date of 'To'.
+    
+    Args:
+        df: DataFrame with 'From' and 'To' datetime columns
+        
+    Returns:
+        Series of dates aligned with df's index
+    """
+    return df['To'].dt.date
+
 def sync_from_gdrive():
     """
     Orchestrates the GDrive sync process.
@@ -225,15 +352,17 @@ def sync_from_gdrive():
                     # Perform all data processing before inserting into DB
                     new_df.rename(columns={'Sleep Quality': 'Rating', 'Deep sleep': 'DeepSleep'}, inplace=True, errors='ignore')
                     
-                    for col in DATE_COLUMNS:
-                        new_df[col] = pd.to_datetime(new_df[col], format=DATE_FORMAT, errors='coerce')
+                    # Filter for 2025+ data on 'From' first so the remaining
+                    # date columns are only parsed for rows that are kept
+                    # (columns download_zip already returned as datetimes are not re-parsed)
+                    new_df = _coerce_datetime_columns(new_df, date_columns=['From'])
+                    new_df = new_df[new_df['From'].dt.year >= TARGET_YEAR].copy()
+                    new_df = _coerce_datetime_columns(
+                        new_df, date_columns=[col for col in DATE_COLUMNS if col != 'From'])
 
                     # This is a simplified version of timezone processing for the sync.
                     # A more robust implementation could be added later if needed.
                     
-                    # Filter for 2025+ data
-                    new_df = new_df[new_df['From'].dt.year >= TARGET_YEAR]
-                    
                     if not new_df.empty:
                         insert_new_data(new_df)
                         st.success("Google Drive sync complete! New data has been added.")
@@ -252,13 +381,43 @@ def sync_from_gdrive():
         st.error(f"GDrive sync failed: {str(e)}")
         return False
 
-@st.cache_data
+def _file_fingerprint(path):
+    """(path, mtime, size) for a file, or just the path if it cannot be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, None, None)
+    return (path, stat.st_mtime, stat.st_size)
+
 def load_data(uploaded_file=None):
     """
     Load sleep data from the local SQLite database if enabled,
     otherwise fall back to loading from the latest CSV file.
     Returns a DataFrame and a string describing the source.
+    
+    Results are cached on a fingerprint of the sources (upload digest,
+    latest file and DB path/mtime/size) so reruns skip the read entirely
+    until one of them actually changes.
     """
+    if uploaded_file is not None:
+        source_key = ('upload', hashlib.blake2b(uploaded_file.getvalue()).hexdigest())
+    else:
+        latest_file = find_latest_data_file()
+        source_key = ('file', _file_fingerprint(latest_file) if latest_file else None)
+    
+    if ENABLE_DB:
+        from src.db_manager import DB_PATH
+        source_key += ('db', _file_fingerprint(DB_PATH))
+    
+    return _load_data(source_key, uploaded_file)
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _load_data(source_key, _uploaded_file=None):
+    """
+    Cached body of load_data(); source_key identifies the inputs and the
+    underscore-prefixed upload is excluded from hashing.
+    """
+    uploaded_file = _uploaded_file
     df = pd.DataFrame()
     source_desc = "No data loaded."
     
@@ -273,7 +432,7 @@ def load_data(uploaded_file=None):
     if df.empty:
         if uploaded_file:
             try:
-                df = pd.read_csv(uploaded_file, parse_dates=DATE_COLUMNS, dayfirst=True, date_format=DATE_FORMAT)
+                df = _read_sleep_csv(uploaded_file)
                 source_desc = "uploaded file"
             except (ValueError, csv.Error) as e:
                 st.error(f"Error parsing uploaded file: {e}. Please ensure it is a valid Sleep as Android CSV.")
@@ -281,7 +440,7 @@ def load_data(uploaded_file=None):
         else:
             latest_file = find_latest_data_file()
             if latest_file:
-                df = pd.read_csv(latest_file, parse_dates=DATE_COLUMNS, dayfirst=True, date_format=DATE_FORMAT)
+                df = _read_sleep_csv(latest_file)
                 source_desc = f"local file: {Path(latest_file).name}"
             else:
                 st.error("No data files found in the 'data' folder. Please add a sleep-export CSV file.")
@@ -291,17 +450,29 @@ def load_data(uploaded_file=None):
     df = _coerce_datetime_columns(df)
     df = _coerce_numeric_columns(df)
 
+    # Timezones are low-cardinality; categorical codes make value_counts cheap
+    if 'Tz' in df.columns:
+        df['Tz'] = df['Tz'].astype('category')
+
     # Centralize notification logic
-    if 'notifications' not in st.session_state:
-        st.session_state.notifications = []
+    notifications = _ensure_notifications()
     
     if df.empty:
         st.warning("Loaded data is empty. The dashboard may not display correctly.")
     else:
-        st.session_state.notifications.append(f"📊 Successfully loaded data from: {source_desc}")
+        notifications.append(f"📊 Successfully loaded data from: {source_desc}")
 
     return df, source_desc
 
+def clear_data_cache():
+    """
+    Clear only the cached file scans and loaded data.
+    Processing caches are cleared separately via clear_processing_cache().
+    """
+    find_latest_data_file.clear()
+    list_data_files.clear()
+    _load_data.clear()
+
 # process_data function is removed as processing logic is now handled in other functions.
 # The `process_timezone_aware_dates` function is complex and its full logic
 # should be reviewed and integrated carefully post-sync.
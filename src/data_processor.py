@@ -5,12 +5,78 @@ Eliminates duplicate data processing across tabs by providing cached, pre-proces
 import streamlit as st
 import pandas as pd
 import numpy as np
+import hashlib
 from datetime import datetime
+from functools import lru_cache, partial
 
-from .data_loader import assign_sleep_date
-from .config import TARGET_YEAR, QUALITY_METRICS
+from .data_loader import assign_sleep_dates
+from .config import TARGET_YEAR, QUALITY_METRICS, DAY_ORDER, DATE_COLUMNS
 
-@st.cache_data
+# "HH:MM" label for every minute of the day, indexed by minute-of-day
+_CLOCK_LABELS = np.array([f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60)], dtype=object)
+
+def format_clock_times(times):
+    """
+    Format a datetime Series as "HH:MM" strings.
+    Uses a minute-of-day lookup table instead of per-row strftime; NaT becomes None.
+    """
+    minutes = (times.dt.hour * 60 + times.dt.minute).to_numpy(dtype=float, na_value=np.nan)
+    valid = ~np.isnan(minutes)
+    labels = np.full(len(times), None, dtype=object)
+    labels[valid] = _CLOCK_LABELS[minutes[valid].astype(np.int64)]
+    return pd.Series(labels, index=times.index)
+
+def _frame_fingerprint(df, columns=None):
+    """
+    Cache key for a sleep DataFrame: shape, column names, dtypes and a vectorized
+    content hash of `columns` (every column when None). Much cheaper than the
+    default of pickling the whole frame on each cached call, and any edit to the
+    hashed values, their order or their dtype changes the key.
+    """
+    key = [df.shape, tuple(df.columns), tuple(df.dtypes.astype(str))]
+    hashed = list(df.columns) if columns is None else [col for col in columns if col in df.columns]
+    if hashed and len(df) > 0:
+        row_hashes = pd.util.hash_pandas_object(df[hashed], index=True).to_numpy()
+        key.append(hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest())
+    return tuple(key)
+
+def _df_hash(columns=None):
+    """hash_funcs for st.cache_data that key DataFrames on the content of `columns`."""
+    return {pd.DataFrame: partial(_frame_fingerprint, columns=columns)}
+
+_DF_HASH = _df_hash()
+# Narrower keys for the cached views of the full export that only read a few columns
+_INTERVAL_HASH = _df_hash(['From', 'To', 'Hours'])
+_OVERVIEW_HASH = _df_hash(['From', 'Hours', *QUALITY_METRICS])
+_SIDEBAR_HASH = _df_hash([*DATE_COLUMNS, 'Tz'])
+
+def minmax_decimate_indices(values, n_out):
+    """
+    Return sorted positional indices that keep the min and max of each of
+    ~n_out/2 equal-size buckets, so long series keep their visible envelope
+    while far fewer points are sent to the browser.
+    """
+    n = len(values)
+    if n <= n_out:
+        return np.arange(n)
+    n_buckets = max(n_out // 2, 1)
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.int64)
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+    # Sort by value within each (contiguous) bucket: first is min, last is max
+    order = np.lexsort((np.asarray(values, dtype=float), bucket))
+    return np.unique(np.concatenate([order[edges[:-1]], order[edges[1:] - 1]]))
+
+@st.cache_data(show_spinner=False)
+def compute_histogram(values, bins):
+    """
+    Bin `values` with np.histogram, ignoring NaN.
+    Returns (counts, bin_centers, bin_widths) ready to draw as a go.Bar.
+    """
+    values = np.asarray(values, dtype=float)
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+    return counts, (edges[:-1] + edges[1:]) / 2, np.diff(edges)
+
+@st.cache_data(hash_funcs=_DF_HASH)
 def get_base_sleep_data(df):
     """
     Create the base filtered and processed sleep data used across all tabs.
@@ -19,27 +85,39 @@ def get_base_sleep_data(df):
     if df is None or len(df) == 0:
         return pd.DataFrame()
     
-    # Base filtering - used by all tabs
-    base_df = df.copy()
+    # Base filtering - used by all tabs. Masks are combined into one selection
+    mask = np.ones(len(df), dtype=bool)
     
     # Filter for target year (2025) if date column exists
-    if 'From' in base_df.columns and pd.api.types.is_datetime64_any_dtype(base_df['From']):
-        base_df = base_df[base_df['From'].dt.year == TARGET_YEAR].copy()
+    if 'From' in df.columns and pd.api.types.is_datetime64_any_dtype(df['From']):
+        mask &= (df['From'].dt.year == TARGET_YEAR).to_numpy()
     
     # Ensure Hours column is numeric and filter legitimate sleep periods
-    if 'Hours' in base_df.columns:
-        # Convert to numeric, coercing errors to NaN
-        base_df['Hours'] = pd.to_numeric(base_df['Hours'], errors='coerce')
-        base_df = base_df[base_df['Hours'] > 0].copy()
+    hours = None
+    if 'Hours' in df.columns:
+        hours = df['Hours']
+        if not pd.api.types.is_numeric_dtype(hours):
+            # Convert to numeric, coercing errors to NaN
+            hours = pd.to_numeric(hours, errors='coerce')
+        mask &= (hours > 0).to_numpy()
+    
+    # Boolean selection already returns a new frame, so no extra copy is taken
+    base_df = df.loc[mask]
+    if hours is not None and hours.dtype != df['Hours'].dtype:
+        base_df = base_df.assign(Hours=hours[mask])
     
     return base_df
 
-@st.cache_data
+@st.cache_data(hash_funcs=_INTERVAL_HASH)
 def get_duration_analysis_data(df):
     """
     Prepare data specifically for sleep duration analysis tab.
     Returns processed data with date assignments and daily aggregations.
     """
+    # Cheap guards first so empty or incomplete frames never reach the base filter
+    if df is None or len(df) == 0 or not {'From', 'To', 'Hours'}.issubset(df.columns):
+        return None, None, {}
+    
     base_df = get_base_sleep_data(df)
     if len(base_df) == 0:
         return None, None, {}
@@ -48,17 +126,29 @@ def get_duration_analysis_data(df):
     plot_df = base_df[['From', 'To', 'Hours']].copy()
     
     # Add intelligent date assignment
-    plot_df['Date'] = plot_df.apply(assign_sleep_date, axis=1)
+    plot_df['Date'] = assign_sleep_dates(plot_df)
     
     # Create daily sleep aggregation
     daily_sleep = plot_df.groupby('Date')['Hours'].sum().reset_index()
     daily_sleep['Date'] = pd.to_datetime(daily_sleep['Date'])
     
+    # Weekday as an ordered categorical, computed once here for every weekday view
+    daily_sleep['Day_of_Week'] = pd.Categorical.from_codes(
+        daily_sleep['Date'].dt.dayofweek, categories=DAY_ORDER, ordered=True)
+    
+    # Sleep hours need far less than float64 precision; float32 halves the
+    # memory every downstream rolling/mean/histogram pass has to touch
+    plot_df['Hours'] = plot_df['Hours'].astype('float32')
+    daily_sleep['Hours'] = daily_sleep['Hours'].astype('float32')
+    
     # Calculate processing statistics
     total_records = len(plot_df)
     unique_dates = len(daily_sleep)
     multi_session_days = total_records - unique_dates
-    cross_midnight_count = len(plot_df[plot_df['From'].dt.date != plot_df['To'].dt.date])
+    # Compare calendar days as datetime64[D] arrays instead of boxing datetime.date objects
+    from_days = plot_df['From'].to_numpy().astype('datetime64[D]')
+    to_days = plot_df['To'].to_numpy().astype('datetime64[D]')
+    cross_midnight_count = int((from_days != to_days).sum())
     
     processing_info = {
         'total_records': total_records,
@@ -69,12 +159,28 @@ def get_duration_analysis_data(df):
     
     return plot_df, daily_sleep, processing_info
 
-@st.cache_data
+@st.cache_data(hash_funcs=_DF_HASH)
+def get_daily_summary_stats(daily_sleep):
+    """
+    Headline figures for the duration tab metrics, computed once per dataset.
+    Returns a dict with average, median and range of daily total hours.
+    """
+    hours = daily_sleep['Hours']
+    return {
+        'avg_hours': float(hours.mean()),
+        'median_hours': float(hours.median()),
+        'range_hours': float(hours.max() - hours.min())
+    }
+
+@st.cache_data(hash_funcs=_DF_HASH)
 def get_quality_analysis_data(df):
     """
     Prepare data specifically for sleep quality analysis tab.
     Returns base data with available quality metrics.
     """
+    if df is None or len(df) == 0:
+        return pd.DataFrame(), []
+    
     base_df = get_base_sleep_data(df)
     if len(base_df) == 0:
         return pd.DataFrame(), []
@@ -84,39 +190,51 @@ def get_quality_analysis_data(df):
     
     return base_df, available_metrics
 
-@st.cache_data
+@st.cache_data(hash_funcs=_DF_HASH)
 def get_patterns_analysis_data(df):
     """
     Prepare data specifically for sleep patterns analysis tab.
     Returns data with bedtime/waketime calculations.
     """
-    base_df = get_base_sleep_data(df)
-    if len(base_df) == 0:
+    # Ensure we have the required columns before any filtering work
+    if df is None or len(df) == 0 or 'From' not in df.columns or 'To' not in df.columns:
         return pd.DataFrame()
     
-    # Ensure we have the required columns
-    if 'From' not in base_df.columns or 'To' not in base_df.columns:
+    base_df = get_base_sleep_data(df)
+    if len(base_df) == 0:
         return pd.DataFrame()
     
-    patterns_df = base_df.copy()
-    
-    # Extract bedtime and wake time info (as decimal hours)
-    patterns_df['bedtime'] = patterns_df['From'].dt.hour + patterns_df['From'].dt.minute/60
-    patterns_df['waketime'] = patterns_df['To'].dt.hour + patterns_df['To'].dt.minute/60
-    
-    # Handle cross-midnight wakeup times for visualization
-    patterns_df['waketime_calc'] = patterns_df['waketime'].copy()
-    patterns_df.loc[patterns_df['waketime_calc'] < patterns_df['bedtime'], 'waketime_calc'] += 24
-    
-    # Add day-of-week information
-    patterns_df['day_of_week'] = patterns_df['From'].dt.day_name()
-    
-    # Add flags for analysis
-    patterns_df['is_next_day'] = patterns_df['waketime'] < patterns_df['bedtime']
-    
-    return patterns_df
+    # Extract bedtime and wake time info (as decimal hours; float32 is plenty for a 0-24 scale)
+    bedtime = (base_df['From'].dt.hour.to_numpy() + base_df['From'].dt.minute.to_numpy() / 60).astype(np.float32)
+    waketime = (base_df['To'].dt.hour.to_numpy() + base_df['To'].dt.minute.to_numpy() / 60).astype(np.float32)
+    
+    # Flag wakeups that fall on the next calendar day (computed once, reused below)
+    is_next_day = waketime < bedtime
+    
+    # Build the derived columns in one assign instead of copying and mutating the frame
+    return base_df.assign(
+        bedtime=bedtime,
+        waketime=waketime,
+        # Handle cross-midnight wakeup times for visualization
+        waketime_calc=np.where(is_next_day, waketime + 24, waketime),
+        # Add day-of-week information
+        day_of_week=pd.Categorical.from_codes(base_df['From'].dt.dayofweek.to_numpy(), DAY_ORDER, ordered=True),
+        # Add flags for analysis
+        is_next_day=is_next_day,
+    )
 
-@st.cache_data
+@st.cache_data(hash_funcs=_DF_HASH)
+def get_multi_session_details(plot_df):
+    """
+    Sessions on days with more than one sleep record, sorted by date and
+    longest session first, with From/To pre-formatted as HH:MM.
+    """
+    is_multi = plot_df.groupby('Date', sort=False)['Hours'].transform('size').to_numpy() > 1
+    details = plot_df.loc[is_multi, ['Date', 'From', 'To', 'Hours']]
+    details = details.sort_values(['Date', 'Hours'], ascending=[True, False])
+    return details.assign(From=format_clock_times(details['From']), To=format_clock_times(details['To']))
+
+@st.cache_data(hash_funcs=_OVERVIEW_HASH)
 def get_data_overview_info(df, uploaded_file=None):
     """
     Prepare data for the Raw Data tab overview.
@@ -128,10 +246,13 @@ def get_data_overview_info(df, uploaded_file=None):
     from pathlib import Path
     from .data_loader import find_latest_data_file
     
+    # Only the headline columns are summarized, with the four statistics the overview needs
+    summary_columns = [col for col in ['Hours', *QUALITY_METRICS] if col in df.columns]
+    
     overview_info = {
         'total_records': len(df),
-        'columns': df.columns.tolist(),
-        'data_summary': df.describe()
+        'columns': df.columns,
+        'data_summary': df[summary_columns].agg(['count', 'mean', 'min', 'max'])
     }
     
     # Add date range if available
@@ -156,6 +277,33 @@ def get_data_overview_info(df, uploaded_file=None):
     
     return overview_info
 
+@st.cache_data(hash_funcs=_SIDEBAR_HASH)
+def get_sidebar_stats(df):
+    """
+    Prepare the summary figures shown in the sidebar Data Info block.
+    Returns record count, date range with tracking rate, and top timezones.
+    """
+    stats = {'records': len(df), 'date_range': None, 'top_timezones': {}}
+    
+    date_cols = df.select_dtypes(include=['datetime', 'datetimetz']).columns
+    if len(date_cols) > 0:
+        main_date_col = date_cols[0]
+        min_date = df[main_date_col].min().date()
+        max_date = df[main_date_col].max().date()
+        total_days = (max_date - min_date).days + 1
+        stats['date_range'] = {
+            'start': min_date,
+            'end': max_date,
+            'total_days': total_days,
+            'tracking_rate': len(df) / total_days
+        }
+    
+    if 'Tz' in df.columns:
+        tz_counts = df['Tz'].value_counts()
+        stats['top_timezones'] = tz_counts[tz_counts > 0].head(3).to_dict()
+    
+    return stats
+
 def clear_processing_cache():
     """
     Clear all cached processing data.
@@ -164,12 +312,25 @@ def clear_processing_cache():
     # Clear the specific cache functions
     get_base_sleep_data.clear()
     get_duration_analysis_data.clear()
+    get_daily_summary_stats.clear()
     get_quality_analysis_data.clear()
     get_patterns_analysis_data.clear()
+    get_multi_session_details.clear()
     get_data_overview_info.clear()
+    get_sidebar_stats.clear()
     get_sleep_time_distribution_data.clear()
 
-@st.cache_data
+@lru_cache(maxsize=8)
+def _slot_metadata(interval_minutes):
+    """
+    Slot numbers, "HH:MM" start labels and polar angles for a day split into
+    interval_minutes slots. Constant per interval, so built once per process.
+    """
+    slots_per_day = (24 * 60) // interval_minutes
+    slots = np.arange(slots_per_day)
+    return slots, _CLOCK_LABELS[slots * interval_minutes], (slots * 360) / slots_per_day
+
+@st.cache_data(hash_funcs=_INTERVAL_HASH)
 def get_sleep_time_distribution_data(df, interval_minutes=15):
     """
     Process sleep data into 24-hour time-of-day distribution for polar plot.
@@ -181,62 +342,45 @@ def get_sleep_time_distribution_data(df, interval_minutes=15):
     Returns:
         DataFrame with columns: 'time_slot', 'time_label', 'total_hours', 'degrees'
     """
-    base_df = get_base_sleep_data(df)
-    if len(base_df) == 0:
+    # Ensure we have the required columns before any filtering work
+    if df is None or len(df) == 0 or 'From' not in df.columns or 'To' not in df.columns:
         return pd.DataFrame()
     
-    # Ensure we have required columns
-    if 'From' not in base_df.columns or 'To' not in base_df.columns:
+    base_df = get_base_sleep_data(df)
+    if len(base_df) == 0:
         return pd.DataFrame()
     
     # Calculate number of slots in 24 hours
     slots_per_day = (24 * 60) // interval_minutes
     
-    # Initialize array to accumulate sleep minutes per time slot
-    sleep_minutes_per_slot = np.zeros(slots_per_day)
-    
-    # Process each sleep period
-    for _, row in base_df.iterrows():
-        start_time = row['From']
-        end_time = row['To']
-        
-        if pd.isna(start_time) or pd.isna(end_time):
-            continue
-            
-        # Create minute-by-minute range for this sleep period
-        sleep_duration_minutes = int((end_time - start_time).total_seconds() / 60)
-        
-        for minute_offset in range(sleep_duration_minutes):
-            current_moment = start_time + pd.Timedelta(minutes=minute_offset)
-            
-            # Calculate which time slot this minute belongs to (using time of day only)
-            hour = current_moment.hour
-            minute = current_moment.minute
-            total_minutes_in_day = hour * 60 + minute
-            slot_index = total_minutes_in_day // interval_minutes
-            
-            # Ensure slot_index is valid (handle edge case of exactly midnight)
-            if slot_index >= slots_per_day:
-                slot_index = 0
-                
-            # Add one minute to this slot
-            sleep_minutes_per_slot[slot_index] += 1
-    
-    # Convert to hours and create result DataFrame
-    sleep_hours_per_slot = sleep_minutes_per_slot / 60
-    
-    # Create time labels and other metadata
-    time_data = []
-    for i in range(slots_per_day):
-        slot_start_minutes = i * interval_minutes
-        hours = slot_start_minutes // 60
-        minutes = slot_start_minutes % 60
-        
-        time_data.append({
-            'time_slot': i,
-            'time_label': f"{hours:02d}:{minutes:02d}",
-            'total_hours': sleep_hours_per_slot[i],
-            'degrees': (i * 360) / slots_per_day  # Convert to polar coordinates
-        })
-    
-    return pd.DataFrame(time_data) 
\ No newline at end of file
+    minutes_per_day = 24 * 60
+    
+    # Start minute-of-day and whole-minute duration of each sleep period
+    periods = base_df[['From', 'To']].dropna()
+    start_minutes = (periods['From'].dt.hour * 60 + periods['From'].dt.minute).to_numpy(dtype=np.int64)
+    duration_minutes = np.trunc((periods['To'] - periods['From']).dt.total_seconds().to_numpy() / 60)
+    duration_minutes = duration_minutes.clip(min=0).astype(np.int64)
+    
+    # Every whole day covers each minute once; the remainder covers [start, start + remainder),
+    # accumulated as a difference array over two days and folded back onto one
+    full_days, remainder = np.divmod(duration_minutes, minutes_per_day)
+    edges = (np.bincount(start_minutes, minlength=2 * minutes_per_day + 1)
+             - np.bincount(start_minutes + remainder, minlength=2 * minutes_per_day + 1))
+    coverage = np.cumsum(edges[:-1])
+    sleep_minutes_per_minute = coverage[:minutes_per_day] + coverage[minutes_per_day:] + full_days.sum()
+    
+    # Calculate which time slot each minute of the day belongs to
+    slot_of_minute = np.arange(minutes_per_day) // interval_minutes
+    # Ensure slot_index is valid (minutes past the last full slot wrap to slot 0)
+    slot_of_minute[slot_of_minute >= slots_per_day] = 0
+    sleep_minutes_per_slot = np.bincount(slot_of_minute, weights=sleep_minutes_per_minute,
+                                         minlength=slots_per_day)
+    
+    # Convert to hours and create result DataFrame with time labels and polar coordinates
+    time_slot, time_label, degrees = _slot_metadata(interval_minutes)
+    return pd.DataFrame({
+        'time_slot': time_slot,
+        'time_label': time_label,
+        'total_hours': sleep_minutes_per_slot / 60,
+        'degrees': degrees,
+    }) 
\ No newline at end of file
@@ -7,9 +7,15 @@ import sqlite3
 import pandas as pd
 from datetime import datetime
 
+from .config import TARGET_YEAR
+
 DB_PATH = 'data/sleep_data.db'
 TABLE_NAME = 'sleep_records'
 
+# Column order of the INSERT statement (and of load_from_db's SELECT)
+INSERT_COLUMNS = ['Id', 'Tz', 'From', 'To', 'Sched', 'Hours', 'Rating', 'Comment', 'Framerate',
+                  'Snore', 'Noise', 'Cycles', 'DeepSleep', 'LenAdjust', 'Geo']
+
 # Define schema based on common columns (expand as needed)
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS sleep_records (
@@ -29,13 +35,27 @@ CREATE TABLE IF NOT EXISTS sleep_records (
     LenAdjust INTEGER,
     Geo TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_sleep_records_from ON sleep_records("From");
 """
 
+def _connect(db_path=DB_PATH):
+    """
+    Open a connection tuned for a local, single-user analytics DB:
+    WAL journal with synchronous=NORMAL (fsync at checkpoints, not every commit),
+    in-memory temp storage and memory-mapped reads.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')
+    return conn
+
 def init_db(db_path=DB_PATH):
     """
     Initialize the SQLite database and create table if not exists.
     """
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path)
     cursor = conn.cursor()
     cursor.executescript(SCHEMA)
     conn.commit()
@@ -47,34 +67,47 @@ def insert_new_data(df, db_path=DB_PATH):
     Filters for year 2025+.
     """
     init_db(db_path)  # Ensure DB and table exist before writing
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path)
     cursor = conn.cursor()
     
     # Filter df for 2025+
     df['From'] = pd.to_datetime(df['From'])
     df = df[df['From'].dt.year >= 2025]
     
-    for _, row in df.iterrows():
-        cursor.execute(f"""
-            INSERT OR IGNORE INTO sleep_records 
-            (Id, Tz, "From", "To", Sched, Hours, Rating, Comment, Framerate, Snore, Noise, Cycles, DeepSleep, LenAdjust, Geo)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            row['Id'], row['Tz'], row['From'], row['To'], row['Sched'], row['Hours'], row['Rating'], 
-            row['Comment'], row.get('Framerate'), row.get('Snore'), row.get('Noise'), row.get('Cycles'), 
-            row.get('DeepSleep'), row.get('LenAdjust'), row.get('Geo')
-        ))
+    # Align to the table's columns once; columns missing from the export become NaN and are stored as NULL
+    records = df.reindex(columns=INSERT_COLUMNS)
+    # sqlite3 has no adapter for pandas Timestamps; store the same text the datetime adapter writes
+    records = records.assign(**{
+        col: records[col].dt.strftime('%Y-%m-%d %H:%M:%S').astype(object).where(records[col].notna(), None)
+        for col in INSERT_COLUMNS if pd.api.types.is_datetime64_any_dtype(records[col])
+    })
+    rows = list(records.itertuples(index=False, name=None))
+    
+    # One prepared statement and one transaction for the whole batch
+    cursor.executemany(f"""
+        INSERT OR IGNORE INTO sleep_records 
+        (Id, Tz, "From", "To", Sched, Hours, Rating, Comment, Framerate, Snore, Noise, Cycles, DeepSleep, LenAdjust, Geo)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
     
     conn.commit()
     conn.close()
 
-def load_from_db(db_path=DB_PATH):
+def load_from_db(db_path=DB_PATH, year_min=TARGET_YEAR):
     """
-    Load all records from DB into DataFrame.
+    Load records starting in year_min or later from DB into DataFrame.
+    The year filter runs in SQLite against the "From" index.
     """
     init_db(db_path)  # Ensure DB and table exist before reading
-    conn = sqlite3.connect(db_path)
-    query = 'SELECT * FROM sleep_records'
-    df = pd.read_sql_query(query, conn, parse_dates=["From", "To", "Sched"])
+    conn = _connect(db_path)
+    columns = ', '.join(f'"{col}"' for col in INSERT_COLUMNS)
+    query = f'SELECT {columns} FROM sleep_records WHERE "From" >= ? ORDER BY "From"'
+    rows = conn.execute(query, (f'{year_min}-01-01',)).fetchall()
     conn.close()
+    
+    # The schema is fixed, so build the frame directly instead of going through read_sql_query
+    df = pd.DataFrame.from_records(rows, columns=INSERT_COLUMNS, coerce_float=True)
+    for col in ("From", "To", "Sched"):
+        # Dates are stored as ISO text by insert_new_data
+        df[col] = pd.to_datetime(df[col], format='ISO8601', errors='coerce')
     return df 
\ No newline at end of file
@@ -10,16 +10,20 @@ from googleapiclient.discovery import build
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload
 import io
 from zipfile import ZipFile
 import pandas as pd
 
+from .config import DATE_COLUMNS, DATE_FORMAT
+
 SECRETS_DIR = 'secrets'
 CREDENTIALS_FILE = os.path.join(SECRETS_DIR, 'gdrive_credentials.json')
 TOKEN_FILE = os.path.join(SECRETS_DIR, 'token.json')
 CONFIG_FILE = os.path.join(SECRETS_DIR, 'config.toml')
 
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # Bytes per request when streaming the export ZIP
 
 def authenticate_gdrive():
     """
@@ -107,7 +111,14 @@ def download_zip(service, file_id):
     """
     try:
         request = service.files().get_media(fileId=file_id)
-        file_content = io.BytesIO(request.execute())
+        
+        # Stream the ZIP into memory in fixed-size chunks rather than one buffered response
+        file_content = io.BytesIO()
+        downloader = MediaIoBaseDownload(file_content, request, chunksize=DOWNLOAD_CHUNK_SIZE)
+        done = False
+        while not done:
+            _, done = downloader.next_chunk()
+        file_content.seek(0)
         
         # Extract CSV from ZIP in-memory
         with ZipFile(file_content, 'r') as zip_ref:
@@ -115,10 +126,14 @@ def download_zip(service, file_id):
             if not csv_files:
                 raise ValueError("No CSV file found in the ZIP archive.")
             
-            # Read the first CSV file found into a DataFrame
-            with zip_ref.open(csv_files[0]) as csv_file:
-                df = pd.read_csv(csv_file)
-                return df
+            # Read the first CSV file found into a DataFrame, parsing dates up front with
+            # pyarrow; fall back to the default reader if pyarrow is missing or rejects it
+            csv_bytes = zip_ref.read(csv_files[0])
+            try:
+                return pd.read_csv(io.BytesIO(csv_bytes), engine='pyarrow',
+                                   parse_dates=DATE_COLUMNS, date_format=DATE_FORMAT)
+            except (ImportError, ValueError):
+                return pd.read_csv(io.BytesIO(csv_bytes))
 
     except HttpError as e:
         raise RuntimeError(f"Error downloading or processing ZIP file: {e}") 
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Tests for the numeric helpers in advanced_analytics.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.advanced_analytics import analyze_recording_frequency, detect_extreme_outliers, rolling_mean, rolling_stats
+
+
+def test_rolling_mean_matches_pandas():
+    values = np.random.default_rng(1).uniform(4, 10, 50)
+    expected = pd.Series(values).rolling(window=10, min_periods=10).mean().to_numpy()
+    np.testing.assert_allclose(rolling_mean(values, 10), expected, equal_nan=True)
+
+
+def test_rolling_mean_nan_only_affects_windows_containing_it():
+    values = np.arange(1.0, 13.0)
+    values[5] = np.nan
+    expected = pd.Series(values).rolling(window=3, min_periods=3).mean().to_numpy()
+    np.testing.assert_allclose(rolling_mean(values, 3), expected, equal_nan=True)
+
+
+def test_rolling_mean_short_series_is_all_nan():
+    assert np.isnan(rolling_mean([7.0, 8.0], 10)).all()
+
+
+def test_rolling_stats_matches_pandas_var_std_mean():
+    values = np.random.default_rng(2).uniform(4, 10, 60)
+    values[20] = np.nan
+    rolling = pd.Series(values).rolling(window=10, min_periods=10)
+    mean, var, std = rolling_stats(values, 10)
+    np.testing.assert_allclose(mean, rolling.mean().to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(var, rolling.var().to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(std, rolling.std().to_numpy(), equal_nan=True)
+
+
+def test_analyze_recording_frequency_finds_gap_runs():
+    dates = pd.to_datetime(['2025-01-01', '2025-01-02', '2025-01-05', '2025-01-06', '2025-01-08'])
+    daily_sleep = pd.DataFrame({'Date': dates, 'Hours': [7.0, 8.0, 6.5, 7.5, 8.0]})
+    plot_df = daily_sleep.assign(Date=dates.date)
+    stats = analyze_recording_frequency(daily_sleep, plot_df)
+    gaps = stats['gap_periods']
+    assert stats['missing_days'] == 3
+    assert gaps['Start'].dt.strftime('%Y-%m-%d').tolist() == ['2025-01-03', '2025-01-07']
+    assert gaps['End'].dt.strftime('%Y-%m-%d').tolist() == ['2025-01-04', '2025-01-07']
+    assert gaps['Duration_Days'].tolist() == [2, 1]
+
+
+def test_detect_extreme_outliers_ranks_days_and_collects_sessions():
+    dates = pd.date_range('2025-01-01', periods=6, freq='D')
+    daily_sleep = pd.DataFrame({'Date': dates, 'Hours': [7.0, 7.5, 7.2, 2.0, 7.1, 12.0]})
+    plot_df = pd.DataFrame({
+        'Date': dates.date.tolist() + [dates[5].date()],
+        'From': pd.to_datetime(['2024-12-31 23:00', '2025-01-01 23:00', '2025-01-02 23:00',
+                                '2025-01-04 01:00', '2025-01-04 23:00', '2025-01-05 22:00', '2025-01-06 13:00']),
+        'To': pd.to_datetime(['2025-01-01 06:00', '2025-01-02 06:30', '2025-01-03 06:12',
+                              '2025-01-04 03:00', '2025-01-05 06:06', '2025-01-06 07:00', '2025-01-06 16:00']),
+        'Hours': [7.0, 7.5, 7.2, 2.0, 7.1, 9.0, 3.0],
+    })
+    top, details = detect_extreme_outliers(daily_sleep, plot_df, n_outliers=2)
+    assert top['Date'].tolist() == [dates[3], dates[5]]
+    assert [d['Session_Count'] for d in details] == [1, 2]
+    assert details[1]['Longest_Session'] == 9.0
+    assert details[1]['Sessions_Hours'] == [9.0, 3.0]
@@ -0,0 +1,117 @@
+"""
+Tests for the vectorized helpers in data_processor.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import assign_sleep_date, assign_sleep_dates
+from src.data_processor import (
+    _frame_fingerprint,
+    compute_histogram,
+    format_clock_times,
+    get_data_overview_info,
+    get_multi_session_details,
+    get_quality_analysis_data,
+    get_sleep_time_distribution_data,
+    minmax_decimate_indices,
+)
+
+
+def test_format_clock_times_matches_strftime():
+    times = pd.Series(pd.to_datetime([
+        '2025-01-15 22:30', '2025-01-16 00:00', '2025-01-16 07:05', '2025-01-16 23:59'
+    ]))
+    result = format_clock_times(times)
+    assert result.tolist() == times.dt.strftime('%H:%M').tolist()
+
+
+def test_format_clock_times_keeps_index_and_handles_nat():
+    times = pd.Series(pd.to_datetime(['2025-01-15 22:30', None]), index=[10, 20])
+    result = format_clock_times(times)
+    assert result.index.tolist() == [10, 20]
+    assert result.tolist() == ['22:30', None]
+
+
+def test_minmax_decimate_indices_keeps_short_series_whole():
+    assert minmax_decimate_indices(np.arange(10.0), 20).tolist() == list(range(10))
+
+
+def test_minmax_decimate_indices_keeps_bucket_extremes():
+    rng = np.random.default_rng(0)
+    values = rng.normal(7, 1, 10_000)
+    values[1234] = 20.0
+    values[8765] = -5.0
+    idx = minmax_decimate_indices(values, 500)
+    assert len(idx) <= 500
+    assert np.all(np.diff(idx) > 0)
+    assert 1234 in idx and 8765 in idx
+
+
+def test_get_multi_session_details_keeps_only_multi_session_days():
+    plot_df = pd.DataFrame({
+        'Date': pd.to_datetime(['2025-01-01', '2025-01-02', '2025-01-02', '2025-01-03']).date,
+        'From': pd.to_datetime(['2024-12-31 23:00', '2025-01-01 23:30', '2025-01-02 14:00', '2025-01-02 22:45']),
+        'To': pd.to_datetime(['2025-01-01 07:00', '2025-01-02 06:00', '2025-01-02 15:00', '2025-01-03 06:15']),
+        'Hours': [8.0, 6.5, 1.0, 7.5],
+    })
+    details = get_multi_session_details(plot_df)
+    assert details['Hours'].tolist() == [6.5, 1.0]
+    assert details['From'].tolist() == ['23:30', '14:00']
+
+
+def test_compute_histogram_ignores_nan_and_returns_centers():
+    counts, centers, widths = compute_histogram([0.5, 1.5, 1.7, np.nan, 23.9], np.arange(0, 25))
+    assert counts.sum() == 4
+    assert counts[1] == 2
+    assert centers[0] == 0.5 and np.all(widths == 1)
+
+
+def test_assign_sleep_dates_matches_row_rule():
+    df = pd.DataFrame({
+        'From': pd.to_datetime(['2025-01-15 22:30', '2025-01-16 13:00', '2025-01-16 23:59']),
+        'To': pd.to_datetime(['2025-01-16 06:30', '2025-01-16 14:30', '2025-01-17 00:10']),
+    })
+    expected = [assign_sleep_date(row) for _, row in df.iterrows()]
+    assert assign_sleep_dates(df).tolist() == expected
+
+
+def test_sleep_time_distribution_wraps_past_midnight():
+    df = pd.DataFrame({
+        'From': pd.to_datetime(['2025-01-15 23:30', '2025-01-16 13:00']),
+        'To': pd.to_datetime(['2025-01-16 00:30', '2025-01-16 13:20']),
+        'Hours': [1.0, 0.33],
+    })
+    dist = get_sleep_time_distribution_data(df, interval_minutes=60)
+    assert len(dist) == 24
+    assert dist['total_hours'].sum() == (60 + 20) / 60
+    assert dist.loc[23, 'total_hours'] == 0.5 and dist.loc[0, 'total_hours'] == 0.5
+    assert dist.loc[13, 'time_label'] == '13:00' and dist.loc[6, 'degrees'] == 90
+
+
+def test_frame_fingerprint_tracks_dtypes_and_content():
+    df = pd.DataFrame({
+        'From': pd.to_datetime(['2025-01-15 22:30', '2025-01-16 23:00']),
+        'Hours': [8.0, 7.0],
+        'Rating': [3.0, 4.0],
+    })
+    key = _frame_fingerprint(df)
+    assert _frame_fingerprint(df.copy()) == key
+    assert _frame_fingerprint(df.assign(Rating=[3.0, 5.0])) != key
+    assert _frame_fingerprint(df.astype({'Hours': 'float32'})) != key
+    assert _frame_fingerprint(df.iloc[::-1]) != key
+    assert _frame_fingerprint(df.assign(Rating=[3.0, 5.0]), columns=['From', 'Hours']) == _frame_fingerprint(df, columns=['From', 'Hours'])
+
+
+def test_quality_and_overview_caches_see_edited_metrics():
+    df = pd.DataFrame({
+        'From': pd.to_datetime(['2025-01-15 22:30', '2025-01-16 23:00']),
+        'To': pd.to_datetime(['2025-01-16 06:30', '2025-01-17 06:00']),
+        'Hours': [8.0, 7.0],
+        'DeepSleep': [3.0, 4.0],
+    })
+    edited = df.assign(DeepSleep=[1.0, 2.0])
+    assert get_data_overview_info(df, uploaded_file='upload')['data_summary'].loc['mean', 'DeepSleep'] == 3.5
+    assert get_data_overview_info(edited, uploaded_file='upload')['data_summary'].loc['mean', 'DeepSleep'] == 1.5
+    assert get_quality_analysis_data(df)[0]['DeepSleep'].tolist() == [3.0, 4.0]
+    assert get_quality_analysis_data(edited)[0]['DeepSleep'].tolist() == [1.0, 2.0]
@@ -0,0 +1,28 @@
+"""
+Tests for the SQLite storage in db_manager.py
+"""
+
+import pandas as pd
+
+from src.db_manager import insert_new_data, load_from_db
+
+
+def test_insert_new_data_skips_duplicates_and_old_years(tmp_path):
+    db_path = str(tmp_path / 'sleep.db')
+    df = pd.DataFrame({
+        'Id': ['1', '2', '3'],
+        'Tz': ['UTC', 'UTC', 'Europe/London'],
+        'From': pd.to_datetime(['2025-01-01 23:00', '2024-05-01 22:00', '2025-02-01 23:15']),
+        'To': pd.to_datetime(['2025-01-02 07:00', '2024-05-02 06:00', None]),
+        'Sched': pd.to_datetime(['2025-01-02 07:00', None, None]),
+        'Hours': [8.0, 8.0, 7.5],
+        'Rating': [3.0, None, 4.0],
+        'Comment': ['#home', None, ''],
+    })
+    insert_new_data(df.copy(), db_path)
+    insert_new_data(df.copy(), db_path)
+
+    loaded = load_from_db(db_path)
+    assert loaded['Id'].tolist() == ['1', '3']
+    assert loaded['From'].tolist() == list(df['From'].iloc[[0, 2]])
+    assert pd.isna(loaded.loc[1, 'To']) and loaded['Geo'].isna().all()
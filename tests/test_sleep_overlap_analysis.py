@@ -18,10 +18,20 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import sys
 import os
+import re
+import fnmatch
 
 # Add the parent directory to the path so we can import from main.py
 sys.path.append(str(Path(__file__).parent.parent))
 
+# Date math below runs on int64 nanosecond views of From/To rather than boxed timestamps
+NS_PER_HOUR = 3_600_000_000_000
+NS_PER_DAY = 86_400_000_000_000
+
+def as_ns(times):
+    """Return a datetime Series as an int64 nanosecond array (a view, no copy)"""
+    return times.to_numpy(dtype='datetime64[ns]').view('i8')
+
 def find_latest_data_file():
     """Find the latest data file (copied from main.py)"""
     data_dir = Path("data")
@@ -36,15 +46,71 @@ def find_latest_data_file():
         "sleep-export_????????.csv",          # sleep-export_YYYYMMDD.csv (legacy)
         "sleep-export.csv"                    # sleep-export.csv (legacy)
     ]
+    regexes = [re.compile(fnmatch.translate(pattern)) for pattern in patterns]
+    
+    # One directory read: bucket each file under the first pattern it matches
+    buckets = {}
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            for priority, regex in enumerate(regexes):
+                if regex.match(entry.name):
+                    buckets.setdefault(priority, []).append(entry)
+                    break
+    
+    if not buckets:
+        return None
     
-    for pattern in patterns:
-        files = list(data_dir.glob(pattern))
-        if files:
-            # Sort by filename (which includes date) and return the latest
-            latest_file = sorted(files, key=lambda x: x.name, reverse=True)[0]
-            return str(latest_file)
+    # Sort by filename (which includes date) and return the latest of the best pattern
+    latest_file = max(buckets[min(buckets)], key=lambda entry: entry.name)
+    return latest_file.path
+
+DATE_FORMAT = '%d. %m. %Y %H:%M'
+ANALYSIS_COLUMNS = ['Tz', 'From', 'To', 'Sched', 'Hours']
+
+def read_2025_rows_pyarrow(data_file):
+    """
+    Stream the 2025 rows of the export through pyarrow. Returns None if pyarrow is not
+    installed or the file has short rows, which only pandas pads with NaN.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from pyarrow import csv as pcsv
+    except ImportError:
+        return None
     
-    return None
+    # Rows with too many fields are skipped (like on_bad_lines='skip'); short rows are noted
+    # so the caller can re-read with pandas instead of silently losing them
+    short_rows = []
+    def handle_invalid_row(row):
+        if row.actual_columns < row.expected_columns:
+            short_rows.append(row.number)
+        return 'skip'
+    
+    # Read in 4 MiB batches, keeping only the columns analysed below (Tz dictionary-encoded,
+    # so it arrives as a categorical); everything else stays text, because the export repeats
+    # its header row and a typed Hours column would fail on those lines. The file is
+    # memory-mapped rather than copied through a read buffer
+    reader = pcsv.open_csv(
+        pa.memory_map(data_file),
+        read_options=pcsv.ReadOptions(block_size=4 << 20),
+        parse_options=pcsv.ParseOptions(invalid_row_handler=handle_invalid_row),
+        convert_options=pcsv.ConvertOptions(
+            include_columns=ANALYSIS_COLUMNS,
+            include_missing_columns=True,
+            column_types={'Tz': pa.dictionary(pa.int32(), pa.string()), 'Hours': pa.string(),
+                          'From': pa.string(), 'To': pa.string(), 'Sched': pa.string()},
+        ),
+    )
+    
+    # Drop rows outside 2025 batch by batch, so other years are never materialized
+    batches = []
+    for batch in reader:
+        starts = pc.strptime(batch.column('From'), format=DATE_FORMAT, unit='ns', error_is_null=True)
+        batches.append(batch.filter(pc.equal(pc.year(starts), 2025)))
+    if short_rows:
+        return None
+    return pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
 
 def load_and_parse_data():
     """Load and parse sleep data"""
@@ -55,103 +121,125 @@ def load_and_parse_data():
     
     print(f"📊 Loading data from: {Path(data_file).name}")
     
-    # Load the data
-    df = pd.read_csv(data_file, on_bad_lines='skip', low_memory=False, engine='c')
-    
-    # Parse date columns
-    date_format = '%d. %m. %Y %H:%M'
-    for date_col in ['From', 'To', 'Sched']:
-        if date_col in df.columns:
-            df[date_col] = pd.to_datetime(df[date_col], format=date_format, errors='coerce')
-    
-    # Filter for 2025 and valid hours
+    # Load the data, falling back to pandas' C engine when pyarrow is unavailable or
+    # the file has short rows
+    df = read_2025_rows_pyarrow(data_file)
+    if df is None:
+        df = pd.read_csv(data_file, on_bad_lines='skip', engine='c', memory_map=True,
+                         usecols=lambda col: col in ANALYSIS_COLUMNS, dtype={'Tz': 'category'})
+    
+    # Parse date columns in one stacked to_datetime call, so the unique-string cache
+    # also hits across columns (To and Sched usually repeat the same timestamps)
+    date_cols = [col for col in ['From', 'To', 'Sched'] if col in df.columns]
+    if date_cols:
+        stacked = pd.to_datetime(pd.concat([df[col] for col in date_cols], ignore_index=True),
+                                 format=DATE_FORMAT, errors='coerce', cache=True).to_numpy()
+        for i, date_col in enumerate(date_cols):
+            df[date_col] = stacked[i * len(df):(i + 1) * len(df)]
+    
+    # Filter for 2025 (already done while streaming on the pyarrow path) and valid hours
     if 'From' in df.columns and 'Hours' in df.columns:
         df = df[df['From'].dt.year == 2025].copy()
         # Convert Hours to numeric first, then filter
-        df['Hours'] = pd.to_numeric(df['Hours'], errors='coerce')
+        df['Hours'] = pd.to_numeric(df['Hours'], errors='coerce').astype('float32')
         df = df[df['Hours'] > 0].copy()
         df = df.dropna(subset=['From', 'To', 'Hours'])
     
     print(f"✅ Loaded {len(df)} valid sleep records for 2025")
     return df
 
-def assign_sleep_date(row):
-    """Date assignment logic (copied from main.py)"""
-    start_date = row['From'].date()
-    end_date = row['To'].date()
-    
-    # If sleep spans midnight, assign to wake-up date
-    if end_date != start_date:
-        return end_date
-    else:
-        return start_date
+class AnalysisContext:
+    """Sleep records as parallel numpy arrays, built once and shared by every analysis"""
+    __slots__ = ('from_ns', 'to_ns', 'hours', 'start_days', 'end_days', 'crosses_midnight', 'assigned_days')
+
+def build_context(df):
+    """Extract From/To/Hours once and derive the day assignment from them"""
+    ctx = AnalysisContext()
+    ctx.from_ns = as_ns(df['From'])
+    ctx.to_ns = as_ns(df['To'])
+    ctx.hours = df['Hours'].to_numpy()
+    
+    # Sleep that spans midnight goes to the wake-up date (calendar days as integer day numbers)
+    ctx.start_days = ctx.from_ns // NS_PER_DAY
+    ctx.end_days = ctx.to_ns // NS_PER_DAY
+    ctx.crosses_midnight = ctx.start_days != ctx.end_days
+    ctx.assigned_days = np.where(ctx.crosses_midnight, ctx.end_days, ctx.start_days)
+    return ctx
+
+def format_ns(values, fmt):
+    """Format int64 nanosecond timestamps for display with one vectorized strftime call"""
+    return pd.DatetimeIndex(values.view('M8[ns]')).strftime(fmt)
 
-def check_temporal_overlaps(df):
-    """Check for temporal overlaps between sleep records"""
+def check_temporal_overlaps(ctx):
+    """Check for temporal overlaps between sleep records (any pair, not just neighbours)"""
     print("\n🔍 ANALYZING TEMPORAL OVERLAPS")
     print("=" * 50)
     
-    overlaps = []
-    df_sorted = df.sort_values('From').reset_index(drop=True)
-    
-    for i in range(len(df_sorted) - 1):
-        current = df_sorted.iloc[i]
-        next_record = df_sorted.iloc[i + 1]
-        
-        # Check if current sleep ends after next sleep starts
-        if current['To'] > next_record['From']:
-            overlap_duration = current['To'] - next_record['From']
-            overlaps.append({
-                'record_1_idx': i,
-                'record_2_idx': i + 1,
-                'record_1_from': current['From'],
-                'record_1_to': current['To'],
-                'record_1_hours': current['Hours'],
-                'record_2_from': next_record['From'],
-                'record_2_to': next_record['To'],
-                'record_2_hours': next_record['Hours'],
-                'overlap_duration': overlap_duration,
-                'overlap_hours': overlap_duration.total_seconds() / 3600
-            })
-    
-    if overlaps:
+    order = np.argsort(ctx.from_ns, kind='stable')
+    from_ns = ctx.from_ns[order]
+    to_ns = ctx.to_ns[order]
+    hours_arr = ctx.hours[order]
+    positions = np.arange(len(order))
+    
+    # With records sorted by start, every later record starting before record i ends
+    # overlaps it; searchsorted finds that run, so contained records are caught too
+    ends = np.searchsorted(from_ns, to_ns, side='left')
+    ends = np.where(np.isnat(to_ns.view('M8[ns]')), positions + 1, ends)
+    counts = np.maximum(ends - positions - 1, 0)
+    first = np.repeat(positions, counts)
+    second = first + 1 + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    
+    # Overlap is the shared span: from the later start to the earlier end
+    overlap_ns = np.minimum(to_ns[first], to_ns[second]) - from_ns[second]
+    overlap_durations = overlap_ns.view('m8[ns]')
+    overlap_hours = overlap_ns / NS_PER_HOUR
+    
+    # One column per field (no per-overlap dicts); rows are only visited for the printout
+    overlaps = pd.DataFrame({
+        'record_1_idx': first,
+        'record_2_idx': second,
+        'record_1_from': from_ns[first].view('M8[ns]'),
+        'record_1_to': to_ns[first].view('M8[ns]'),
+        'record_1_hours': hours_arr[first],
+        'record_2_from': from_ns[second].view('M8[ns]'),
+        'record_2_to': to_ns[second].view('M8[ns]'),
+        'record_2_hours': hours_arr[second],
+        'overlap_duration': overlap_durations,
+        'overlap_hours': overlap_hours
+    })
+    
+    if len(overlaps) > 0:
         print(f"⚠️  Found {len(overlaps)} temporal overlaps!")
         print("\nOverlap Details:")
-        for i, overlap in enumerate(overlaps[:5]):  # Show first 5
+        for i, overlap in enumerate(overlaps.head(5).itertuples(index=False)):  # Show first 5
             print(f"\nOverlap {i+1}:")
-            print(f"  Record 1: {overlap['record_1_from']} → {overlap['record_1_to']} ({overlap['record_1_hours']:.2f}h)")
-            print(f"  Record 2: {overlap['record_2_from']} → {overlap['record_2_to']} ({overlap['record_2_hours']:.2f}h)")
-            print(f"  Overlap:  {overlap['overlap_hours']:.2f} hours")
+            print(f"  Record 1: {overlap.record_1_from} → {overlap.record_1_to} ({overlap.record_1_hours:.2f}h)")
+            print(f"  Record 2: {overlap.record_2_from} → {overlap.record_2_to} ({overlap.record_2_hours:.2f}h)")
+            print(f"  Overlap:  {overlap.overlap_hours:.2f} hours")
         
         if len(overlaps) > 5:
             print(f"\n... and {len(overlaps) - 5} more overlaps")
             
         # Analyze overlap patterns
-        overlap_hours = [o['overlap_hours'] for o in overlaps]
         print(f"\nOverlap Statistics:")
-        print(f"  Average overlap: {np.mean(overlap_hours):.2f} hours")
-        print(f"  Maximum overlap: {np.max(overlap_hours):.2f} hours")
-        print(f"  Minimum overlap: {np.min(overlap_hours):.2f} hours")
+        print(f"  Average overlap: {overlap_hours.mean():.2f} hours")
+        print(f"  Maximum overlap: {overlap_hours.max():.2f} hours")
+        print(f"  Minimum overlap: {overlap_hours.min():.2f} hours")
         
     else:
         print("✅ No temporal overlaps found - all sleep records are sequential!")
     
     return overlaps
 
-def analyze_date_assignment(df):
+def analyze_date_assignment(ctx):
     """Analyze the date assignment logic"""
     print("\n📅 ANALYZING DATE ASSIGNMENT LOGIC")
     print("=" * 50)
     
-    # Apply date assignment
-    df['assigned_date'] = df.apply(assign_sleep_date, axis=1)
-    df['start_date'] = df['From'].dt.date
-    df['end_date'] = df['To'].dt.date
-    df['crosses_midnight'] = df['start_date'] != df['end_date']
-    
     # Statistics
-    total_records = len(df)
-    crosses_midnight = df['crosses_midnight'].sum()
+    crosses = ctx.crosses_midnight
+    total_records = len(crosses)
+    crosses_midnight = int(crosses.sum())
     same_day = total_records - crosses_midnight
     
     print(f"Sleep Records by Type:")
@@ -161,8 +249,8 @@ def analyze_date_assignment(df):
     
     # Check assignment logic
     print(f"\nDate Assignment Verification:")
-    same_day_correct = df[~df['crosses_midnight']]['assigned_date'].equals(df[~df['crosses_midnight']]['start_date'])
-    cross_midnight_correct = df[df['crosses_midnight']]['assigned_date'].equals(df[df['crosses_midnight']]['end_date'])
+    same_day_correct = np.array_equal(ctx.assigned_days[~crosses], ctx.start_days[~crosses])
+    cross_midnight_correct = np.array_equal(ctx.assigned_days[crosses], ctx.end_days[crosses])
     
     print(f"  Same-day assigned to start date: {'✅' if same_day_correct else '❌'}")
     print(f"  Cross-midnight assigned to end date: {'✅' if cross_midnight_correct else '❌'}")
@@ -170,29 +258,36 @@ def analyze_date_assignment(df):
     # Show examples
     if crosses_midnight > 0:
         print(f"\nCross-Midnight Examples:")
-        examples = df[df['crosses_midnight']].head(3)
-        for _, row in examples.iterrows():
-            print(f"  {row['From'].strftime('%Y-%m-%d %H:%M')} → {row['To'].strftime('%Y-%m-%d %H:%M')} "
-                  f"= assigned to {row['assigned_date']}")
-    
-    return df
+        examples = np.flatnonzero(crosses)[:3]
+        # Format each column in one vectorized strftime call, then just index the strings
+        starts = format_ns(ctx.from_ns[examples], '%Y-%m-%d %H:%M')
+        ends = format_ns(ctx.to_ns[examples], '%Y-%m-%d %H:%M')
+        assigned = format_ns(ctx.assigned_days[examples] * NS_PER_DAY, '%Y-%m-%d')
+        for start, end, assigned_date in zip(starts, ends, assigned):
+            print(f"  {start} → {end} = assigned to {assigned_date}")
 
-def analyze_daily_aggregation(df):
+def analyze_daily_aggregation(ctx):
     """Analyze daily aggregation and look for suspicious totals"""
     print("\n📊 ANALYZING DAILY AGGREGATION")
     print("=" * 50)
     
-    # Group by assigned date
-    daily_totals = df.groupby('assigned_date').agg({
-        'Hours': ['sum', 'count', 'mean', 'max'],
-        'From': 'min',
-        'To': 'max'
+    # Group by assigned date: sort once, then reduce each day's contiguous run with ufunc.reduceat
+    order = np.argsort(ctx.assigned_days, kind='stable')
+    dates = ctx.assigned_days[order]
+    hours = ctx.hours[order]
+    days, starts = np.unique(dates, return_index=True)
+    counts = np.diff(np.r_[starts, len(dates)])
+    total_hours = np.add.reduceat(hours, starts, dtype=np.float64)  # accumulate like groupby does
+    daily_totals = pd.DataFrame({
+        'assigned_date': days.astype('datetime64[D]'),
+        'total_hours': total_hours.astype(hours.dtype),
+        'session_count': counts,
+        'avg_session': (total_hours / counts).astype(hours.dtype),
+        'max_session': np.maximum.reduceat(hours, starts),
+        'earliest_start': np.minimum.reduceat(ctx.from_ns[order], starts).view('M8[ns]'),
+        'latest_end': np.maximum.reduceat(ctx.to_ns[order], starts).view('M8[ns]')
     }).round(2)
     
-    # Flatten column names
-    daily_totals.columns = ['total_hours', 'session_count', 'avg_session', 'max_session', 'earliest_start', 'latest_end']
-    daily_totals = daily_totals.reset_index()
-    
     # Find suspicious days
     suspicious_days = daily_totals[daily_totals['total_hours'] > 12]  # More than 12 hours
     multi_session_days = daily_totals[daily_totals['session_count'] > 1]
@@ -208,55 +303,60 @@ def analyze_daily_aggregation(df):
     # Show suspicious days
     if len(suspicious_days) > 0:
         print(f"\n⚠️  Days with >12 hours sleep:")
-        for _, day in suspicious_days.head(5).iterrows():
-            print(f"  {day['assigned_date']}: {day['total_hours']:.2f}h "
-                  f"({day['session_count']} sessions, max: {day['max_session']:.2f}h)")
+        for day in suspicious_days.head(5).itertuples(index=False):
+            print(f"  {day.assigned_date.date()}: {day.total_hours:.2f}h "
+                  f"({day.session_count} sessions, max: {day.max_session:.2f}h)")
     
     # Show multi-session days
     if len(multi_session_days) > 0:
         print(f"\n📋 Days with multiple sleep sessions (first 5):")
-        for _, day in multi_session_days.head(5).iterrows():
-            print(f"  {day['assigned_date']}: {day['total_hours']:.2f}h total "
-                  f"({day['session_count']} sessions, avg: {day['avg_session']:.2f}h)")
+        for day in multi_session_days.head(5).itertuples(index=False):
+            print(f"  {day.assigned_date.date()}: {day.total_hours:.2f}h total "
+                  f"({day.session_count} sessions, avg: {day.avg_session:.2f}h)")
     
     return daily_totals
 
-def detailed_multi_session_analysis(df):
+def detailed_multi_session_analysis(ctx):
     """Detailed analysis of multi-session days"""
     print("\n🔬 DETAILED MULTI-SESSION ANALYSIS")
     print("=" * 50)
     
-    # Group by date and analyze each day with multiple sessions
-    multi_session_dates = df.groupby('assigned_date').size()
-    multi_session_dates = multi_session_dates[multi_session_dates > 1].index
+    # Sort once by day and start time; each day is then a contiguous run in session order
+    order = np.lexsort((ctx.from_ns, ctx.assigned_days))
+    days, starts, sizes = np.unique(ctx.assigned_days[order], return_index=True, return_counts=True)
+    multi_session = np.flatnonzero(sizes > 1)
     
-    if len(multi_session_dates) == 0:
+    if len(multi_session) == 0:
         print("✅ No multi-session days found")
         return
     
-    print(f"Analyzing {len(multi_session_dates)} days with multiple sessions...\n")
+    print(f"Analyzing {len(multi_session)} days with multiple sessions...\n")
     
-    for date in list(multi_session_dates)[:3]:  # Show first 3 days
-        day_data = df[df['assigned_date'] == date].sort_values('From')
+    day_labels = format_ns(days[multi_session[:3]] * NS_PER_DAY, '%Y-%m-%d')
+    for label, k in zip(day_labels, multi_session[:3]):  # Show first 3 days
+        rows = order[starts[k]:starts[k] + sizes[k]]
+        from_ns = ctx.from_ns[rows]
+        to_ns = ctx.to_ns[rows]
+        hours = ctx.hours[rows]
+        next_day = from_ns // NS_PER_DAY != to_ns // NS_PER_DAY
         
-        print(f"📅 {date} ({len(day_data)} sessions, {day_data['Hours'].sum():.2f}h total):")
+        print(f"📅 {label} ({len(rows)} sessions, {hours.sum():.2f}h total):")
         
-        for i, (_, session) in enumerate(day_data.iterrows(), 1):
-            duration_str = f"{session['From'].strftime('%H:%M')} → {session['To'].strftime('%H:%M')}"
-            if session['From'].date() != session['To'].date():
+        hhmm_from = format_ns(from_ns, '%H:%M')
+        hhmm_to = format_ns(to_ns, '%H:%M')
+        for i, (start, end, session_hours, plus_day) in enumerate(zip(hhmm_from, hhmm_to, hours, next_day), 1):
+            duration_str = f"{start} → {end}"
+            if plus_day:
                 duration_str += " (+1 day)"
             
-            print(f"  Session {i}: {duration_str} = {session['Hours']:.2f}h")
+            print(f"  Session {i}: {duration_str} = {session_hours:.2f}h")
         
-        # Check for gaps between sessions
-        if len(day_data) > 1:
+        # Check for gaps between sessions (next start minus previous end, ns → hours)
+        if len(rows) > 1:
             print("  Gaps between sessions:")
-            for i in range(len(day_data) - 1):
-                current_end = day_data.iloc[i]['To']
-                next_start = day_data.iloc[i + 1]['From']
-                gap = next_start - current_end
-                gap_hours = gap.total_seconds() / 3600
-                print(f"    Gap {i+1}-{i+2}: {gap_hours:.2f} hours")
+            gap_hours = (from_ns[1:] - to_ns[:-1]) / NS_PER_HOUR
+            for i, gap in enumerate(gap_hours):
+                print(f"    Gap {i+1}-{i+2}: {gap:.2f} hours")
         
         print()
 
@@ -277,11 +377,12 @@ def main():
         print("❌ No valid data to analyze")
         return
     
-    # Run analyses
-    overlaps = check_temporal_overlaps(df)
-    df_with_dates = analyze_date_assignment(df)
-    daily_totals = analyze_daily_aggregation(df_with_dates)
-    detailed_multi_session_analysis(df_with_dates)
+    # Run analyses on arrays extracted once, instead of passing and extending the DataFrame
+    ctx = build_context(df)
+    overlaps = check_temporal_overlaps(ctx)
+    analyze_date_assignment(ctx)
+    daily_totals = analyze_daily_aggregation(ctx)
+    detailed_multi_session_analysis(ctx)
     
     # Final summary
     print("\n📋 FINAL SUMMARY")
@@ -289,7 +390,7 @@ def main():
     print(f"✅ Analyzed {len(df)} sleep records")
     print(f"📊 Found {len(daily_totals)} unique days")
     print(f"⚠️  Temporal overlaps: {len(overlaps)}")
-    print(f"🌙 Cross-midnight sleep: {df_with_dates['crosses_midnight'].sum()}")
+    print(f"🌙 Cross-midnight sleep: {ctx.crosses_midnight.sum()}")
     print(f"📅 Multi-session days: {len(daily_totals[daily_totals['session_count'] > 1])}")
     print(f"⏰ Suspicious high totals (>12h): {len(daily_totals[daily_totals['total_hours'] > 12])}")
     
@@ -34,6 +34,7 @@ def test_timezone_processing():
     }
     
     df = pd.DataFrame(sample_data)
+    df['Tz'] = df['Tz'].astype('category')  # as load_data delivers it
     
     print("Original data:")
     print(df[['Tz', 'From', 'To']])
@@ -65,5 +66,25 @@ def test_timezone_processing():
         import traceback
         traceback.print_exc()
 
+def test_dst_transition_times_match_pytz_localize():
+    """Times in the spring-forward gap and the repeated fall-back hour follow pytz's localize()"""
+    from src.data_loader import process_timezone_aware_dates
+    
+    chicago = pytz.timezone('America/Chicago')
+    local_times = [datetime(2025, 3, 9, 2, 30), datetime(2025, 11, 2, 1, 30)]
+    df = pd.DataFrame({
+        'Tz': pd.Categorical(['America/Chicago', 'America/Chicago']),
+        'From': local_times,
+        'Hours': [6.0, 6.0]
+    })
+    
+    df_converted = process_timezone_aware_dates(df, 'UTC')
+    
+    # The original per-row code localized the frame's pd.Timestamp values with pytz
+    expected = [chicago.localize(pd.Timestamp(dt)).astimezone(pytz.UTC) for dt in local_times]
+    assert df_converted['From'].tolist() == expected
+    assert df_converted['From'].iloc[0] == pd.Timestamp('2025-03-09 08:30', tz='UTC')
+
 if __name__ == "__main__":
-    test_timezone_processing() 
\ No newline at end of file
+    test_timezone_processing()
+    test_dst_transition_times_match_pytz_localize() 
\ No newline at end of file